@@ -2,16 +2,20 @@
 City Council Minutes/Agenda Scraper
 Fetches and parses city council meeting documents from municipal websites.
 """
+import html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
+from dateutil import parser as dtparser
 import time
 import csv
 import hashlib
-from pathlib import Path
+from typing import Iterator
 import re
-import pdfplumber
-import tempfile
+from urllib.parse import urljoin
+import pymupdf
 
 from config import (
     CIVIC_KEYWORDS, TARGET_ZIPS,
@@ -20,6 +24,54 @@ from config import (
     RAW_DIR
 )
 
+# Prefer the C-based lxml parser when installed; html.parser is the fallback.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session that retries transient HTTP failures."""
+    retry = Retry(
+        total=SCRAPER_MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    session = requests.Session()
+    session.headers["User-Agent"] = SCRAPER_USER_AGENT
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+# Only document links and the list/table/paragraph containers that carry
+# their dates are built from the index pages.
+PDF_LINK_STRAINER = SoupStrainer(["li", "td", "p", "a"])
+
+# Characters of raw HTML before an href searched for a date when the link
+# sits outside any container kept by the strainer.
+DATE_CONTEXT_CHARS = 300
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Common date patterns, in order of preference
+_DATE_PATTERNS = [
+    re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})'),           # 01/15/2026 or 1-15-2026
+    re.compile(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})'),           # 2026-01-15
+    re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE),
+    re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE),
+]
+
+_WS_RE = re.compile(r'\s+')
+_CLEAN_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' ', '\x0c': ' '})
+
+_CIVIC_KEYWORDS_BYTES = tuple(k.lower().encode() for k in CIVIC_KEYWORDS)
+
 
 # City council document pages
 CITY_COUNCILS = {
@@ -59,16 +111,16 @@ def fetch_pdf_links(city_key: str, max_docs: int = 5) -> list:
     """
     city = CITY_COUNCILS[city_key]
     headers = {
-        "User-Agent": SCRAPER_USER_AGENT,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
     try:
         print(f"Fetching {city['name']} council documents...")
-        response = requests.get(city["url"], headers=headers, timeout=SCRAPER_TIMEOUT)
+        response = SESSION.get(city["url"], headers=headers, timeout=SCRAPER_TIMEOUT)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=PDF_LINK_STRAINER)
+        page_text = response.text
 
         # Find all PDF links
         pdf_links = []
@@ -81,22 +133,17 @@ def fetch_pdf_links(city_key: str, max_docs: int = 5) -> list:
                 title = link.get_text(strip=True)
 
                 # Make absolute URL
-                if href.startswith('http'):
-                    url = href
-                elif href.startswith('/'):
-                    base = city["url"].split('/')[0:3]
-                    url = '/'.join(base) + href
-                else:
-                    url = city["url"].rsplit('/', 1)[0] + '/' + href
+                url = urljoin(city["url"], href)
 
                 # Try to extract date from title or nearby text
                 date = extract_date_from_text(title)
                 if not date:
-                    # Look for date in parent or sibling elements
+                    # Look for date in the containing list item/cell/paragraph
                     parent = link.parent
-                    if parent:
-                        parent_text = parent.get_text()
-                        date = extract_date_from_text(parent_text)
+                    if parent is not soup:
+                        date = extract_date_from_text(parent.get_text())
+                    else:
+                        date = extract_date_near(page_text, href)
 
                 if not date:
                     date = datetime.now().strftime("%Y-%m-%d")
@@ -120,28 +167,33 @@ def fetch_pdf_links(city_key: str, max_docs: int = 5) -> list:
         return []
 
 
+def extract_date_near(page_text: str, href: str) -> str:
+    """Extract the last date in the raw page text just before an href."""
+    pos = page_text.find(href)
+    if pos < 0:
+        # BeautifulSoup unescapes attributes, e.g. &amp; in query strings
+        pos = page_text.find(html.escape(href, quote=False))
+    if pos < 0:
+        return ""
+
+    context = _TAG_RE.sub(' ', page_text[max(0, pos - DATE_CONTEXT_CHARS):pos])
+    matches = [m for pattern in _DATE_PATTERNS for m in pattern.finditer(context)]
+    if not matches:
+        return ""
+    # The nearest preceding date belongs to this link, not an earlier row
+    return parse_date(max(matches, key=lambda m: m.end()).group(0))
+
+
 def extract_date_from_text(text: str) -> str:
     """Extract date from text content."""
     if not text:
         return ""
 
-    # Common date patterns
-    patterns = [
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',           # 01/15/2026 or 1-15-2026
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',           # 2026-01-15
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
-            try:
-                # Try to parse the matched date
-                date_str = match.group(0)
-                return parse_date(date_str)
-            except:
-                continue
+            # parse_date always returns a string (falling back to today)
+            return parse_date(match.group(0))
 
     return ""
 
@@ -151,36 +203,10 @@ def parse_date(date_str: str) -> str:
     if not date_str:
         return datetime.now().strftime("%Y-%m-%d")
 
-    date_str = date_str.strip()
-
-    formats = [
-        "%B %d, %Y",              # January 15, 2026
-        "%b %d, %Y",              # Jan 15, 2026
-        "%m/%d/%Y",               # 01/15/2026
-        "%m-%d-%Y",               # 01-15-2026
-        "%Y-%m-%d",               # 2026-01-15
-        "%Y/%m/%d",               # 2026/01/15
-        "%d %B %Y",               # 15 January 2026
-        "%d %b %Y",               # 15 Jan 2026
-    ]
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-
-    # Try with comma variations
-    date_str_no_comma = date_str.replace(',', '')
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str_no_comma, fmt)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-
-    return datetime.now().strftime("%Y-%m-%d")
+    try:
+        return dtparser.parse(date_str.strip()).strftime("%Y-%m-%d")
+    except (ValueError, OverflowError):
+        return datetime.now().strftime("%Y-%m-%d")
 
 
 def extract_text_from_pdf(pdf_url: str, max_chars: int = 5000) -> str:
@@ -194,33 +220,22 @@ def extract_text_from_pdf(pdf_url: str, max_chars: int = 5000) -> str:
     Returns:
         Extracted text content
     """
-    headers = {"User-Agent": SCRAPER_USER_AGENT}
-
     try:
-        # Download PDF
-        response = requests.get(pdf_url, headers=headers, timeout=30, stream=True)
+        # Download PDF (transient failures are retried by the session)
+        response = SESSION.get(pdf_url, timeout=30)
         response.raise_for_status()
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                tmp_file.write(chunk)
-            tmp_path = tmp_file.name
-
-        # Extract text using pdfplumber
+        # Extract text using PyMuPDF straight from the downloaded bytes
         text = ""
-        with pdfplumber.open(tmp_path) as pdf:
-            # Extract from first few pages (usually most relevant)
-            for page in pdf.pages[:10]:  # First 10 pages max
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-
+        with pymupdf.open(stream=response.content, filetype="pdf") as doc:
+            # Extract from first few pages (usually most relevant), stopping
+            # before a page is loaded once the character budget is met
+            for i in range(min(doc.page_count, 10)):  # First 10 pages max
                 if len(text) >= max_chars:
                     break
-
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+                page_text = doc.load_page(i).get_text()
+                if page_text:
+                    text += page_text + "\n"
 
         # Clean text
         text = clean_text(text)
@@ -233,29 +248,28 @@ def extract_text_from_pdf(pdf_url: str, max_chars: int = 5000) -> str:
 
 def clean_text(text: str) -> str:
     """Clean up text content."""
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    # Remove special characters that might cause issues
-    text = text.replace('\n', ' ').replace('\r', ' ')
-    return text
+    # Map line breaks to spaces, then collapse whitespace in one pass
+    return _WS_RE.sub(' ', text.translate(_CLEAN_TRANS)).strip()
 
 
 def is_relevant(text: str, title: str = "") -> bool:
     """
     Check if document content is relevant to civic immigration issues.
     """
-    text_lower = text.lower()
-    title_lower = title.lower()
+    # Search UTF-8 bytes so each probe is a plain C memory search; keywords
+    # are ASCII, so bytes.lower() matches str.lower() for every hit we need.
+    text_bytes = text.encode('utf-8', 'ignore').lower()
+    title_bytes = title.encode('utf-8', 'ignore').lower()
 
     # Check for civic keywords
-    for keyword in CIVIC_KEYWORDS:
-        if keyword.lower() in text_lower or keyword.lower() in title_lower:
+    for keyword in _CIVIC_KEYWORDS_BYTES:
+        if text_bytes.find(keyword) >= 0 or title_bytes.find(keyword) >= 0:
             return True
 
     return False
 
 
-def process_city_documents(city_key: str, max_docs: int = 5) -> list:
+def process_city_documents(city_key: str, max_docs: int = 5) -> Iterator[dict]:
     """
     Process documents for a single city.
 
@@ -263,17 +277,16 @@ def process_city_documents(city_key: str, max_docs: int = 5) -> list:
         city_key: Key from CITY_COUNCILS dict
         max_docs: Maximum number of documents to process
 
-    Returns:
-        List of relevant record dicts
+    Yields:
+        Relevant record dicts, one per document, as soon as each is ready
     """
     pdf_links = fetch_pdf_links(city_key, max_docs)
 
-    if not pdf_links:
-        return []
-
-    records = []
-
     for i, doc in enumerate(pdf_links):
+        # Rate limiting: pause between downloads, not after the last one
+        if i:
+            time.sleep(SCRAPER_REQUEST_DELAY)
+
         print(f"  Processing [{i+1}/{len(pdf_links)}]: {doc['title'][:50]}...")
 
         # Extract text from PDF
@@ -289,7 +302,7 @@ def process_city_documents(city_key: str, max_docs: int = 5) -> list:
             continue
 
         # Generate unique ID
-        content_hash = hashlib.md5(f"{doc['title']}{doc['url']}".encode()).hexdigest()[:12]
+        content_hash = hashlib.blake2b(f"{doc['title']}{doc['url']}".encode(), digest_size=6).hexdigest()
 
         # Create record
         record = {
@@ -303,13 +316,8 @@ def process_city_documents(city_key: str, max_docs: int = 5) -> list:
             "zip": doc["zip"],
         }
 
-        records.append(record)
         print(f"    Added (relevant)")
-
-        # Rate limiting
-        time.sleep(SCRAPER_REQUEST_DELAY)
-
-    return records
+        yield record
 
 
 def run_scraper(cities: list = None, max_docs_per_city: int = 5) -> dict:
@@ -328,46 +336,54 @@ def run_scraper(cities: list = None, max_docs_per_city: int = 5) -> dict:
     if cities is None:
         cities = list(CITY_COUNCILS.keys())
 
-    all_records = []
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = RAW_DIR / f"council_minutes_{timestamp}.csv"
+    fieldnames = ["id", "text", "title", "source", "category", "url", "date", "zip"]
 
-    for city_key in cities:
-        if city_key not in CITY_COUNCILS:
-            print(f"Warning: Unknown city '{city_key}'")
-            continue
+    total = 0
+    sample_records = []
 
-        print(f"\nProcessing {CITY_COUNCILS[city_key]['name']}...")
-        city_records = process_city_documents(city_key, max_docs_per_city)
-        all_records.extend(city_records)
+    # Write each record as soon as it is produced so memory stays flat
+    # and a partial CSV survives if the crawl is interrupted.
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
 
-        print(f"  Found {len(city_records)} relevant documents")
+        for city_key in cities:
+            if city_key not in CITY_COUNCILS:
+                print(f"Warning: Unknown city '{city_key}'")
+                continue
 
-    print(f"\nTotal relevant records: {len(all_records)}")
+            print(f"\nProcessing {CITY_COUNCILS[city_key]['name']}...")
+            city_count = 0
+            for record in process_city_documents(city_key, max_docs_per_city):
+                writer.writerow(record)
+                f.flush()
+                city_count += 1
+                if len(sample_records) < 3:
+                    sample_records.append(record)
 
-    # Save to CSV
-    if all_records:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = RAW_DIR / f"council_minutes_{timestamp}.csv"
+            total += city_count
+            print(f"  Found {city_count} relevant documents")
 
-        with open(output_file, "w", encoding="utf-8", newline="") as f:
-            fieldnames = ["id", "text", "title", "source", "category", "url", "date", "zip"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_records)
+    print(f"\nTotal relevant records: {total}")
 
+    if total:
         print(f"\nSaved to: {output_file}")
 
         # Print sample
         print("\nSample records:")
-        for i, record in enumerate(all_records[:3]):
+        for i, record in enumerate(sample_records):
             print(f"\n[{i+1}] {record['title'][:60]}")
             print(f"    Source: {record['source']}")
             print(f"    Date: {record['date']}, ZIP: {record['zip']}")
             print(f"    URL: {record['url']}")
     else:
+        output_file.unlink(missing_ok=True)
         print("\nNo relevant records to save")
 
     return {
-        "total": len(all_records),
+        "total": total,
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -8,31 +8,162 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import json
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 PROCESSED_DIR = Path(__file__).parent.parent / "data" / "processed"
 BUILD_DIR = Path(__file__).parent.parent / "build"
 
 
+def _read_csv(path, date_cols, dictionary_cols=()):
+    """
+    Read a processed CSV with its date columns parsed.
+
+    Uses Arrow's multithreaded CSV reader when pyarrow is installed, which
+    parses ISO dates inline and dictionary-encodes low-cardinality string
+    columns; falls back to pandas otherwise.
+    """
+    if PYARROW_AVAILABLE:
+        column_types = {col: pa.dictionary(pa.int32(), pa.string()) for col in dictionary_cols}
+        # strings_can_be_null matches pandas, which reads empty cells as NaN
+        table = pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True
+            ),
+        )
+        df = table.to_pandas()
+    else:
+        df = pd.read_csv(path)
+
+    # Arrow only infers ISO-8601; parse anything else the pandas way
+    for col in date_cols:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col])
+    return df
+
+
+def _bin_counts(values, bins, n_bins, right=True):
+    """
+    Count values per bin, like pd.cut(...).value_counts() in bin order.
+
+    Uses np.searchsorted + np.bincount instead of building a Categorical.
+    Values outside the bin edges (and NaN) are not counted.
+    """
+    idx = np.searchsorted(bins, values.to_numpy(dtype=float), side='left' if right else 'right') - 1
+    idx = idx[(idx >= 0) & (idx < n_bins)]
+    return np.bincount(idx, minlength=n_bins)
+
+
+def _records_aggregates_polars(path):
+    """Records aggregations as one lazy Polars query plan over the CSV."""
+    records = pl.scan_csv(path, try_parse_dates=True)
+    date_col = pl.col('date')
+    if records.collect_schema()['date'] == pl.String:
+        date_col = date_col.str.to_datetime()
+
+    daily = (
+        records.group_by(date_col.dt.date().alias('date'))
+        .agg(
+            pl.col('id').count().alias('records'),
+            pl.col('source').drop_nulls().n_unique().alias('sources'),
+        )
+        .drop_nulls('date')
+        .sort('date')
+    )
+    sources = (
+        records.drop_nulls('source')
+        .group_by('source', maintain_order=True)
+        .agg(pl.len().alias('count'))
+        .sort('count', descending=True, maintain_order=True)
+    )
+    totals = records.select(
+        pl.len().alias('total_records'), date_col.max().alias('latest_date')
+    )
+
+    # Collected together so the shared CSV scan runs once
+    daily, sources, totals = pl.collect_all([daily, sources, totals])
+
+    daily_ingestion = pd.DataFrame(daily.to_dict(as_series=False))
+    daily_ingestion['date'] = daily_ingestion['date'].astype(str)
+    source_counts = pd.DataFrame(sources.to_dict(as_series=False))
+    return daily_ingestion, source_counts, totals['total_records'][0], totals['latest_date'][0]
+
+
+def _records_aggregates_pandas(path):
+    """Records aggregations computed with pandas (fallback without Polars)."""
+    records_df = _read_csv(path, ['date'], dictionary_cols=['source'])
+
+    # Group on an integer-backed datetime64[D] key rather than date objects
+    day_key = records_df['date'].values.astype('datetime64[D]')
+
+    # Distinct sources per day: factorize once and count unique
+    # (day, source code) pairs instead of a per-group nunique
+    source_codes, _ = pd.factorize(records_df['source'])
+    day_sources = pd.DataFrame({'date': day_key, 'source': source_codes})
+    day_sources = day_sources[day_sources['source'] >= 0].drop_duplicates()
+
+    daily_ingestion = pd.DataFrame({
+        'records': records_df['id'].groupby(day_key).count(),
+        'sources': day_sources.groupby('date').size(),
+    }).fillna(0).astype(int).rename_axis('date').reset_index()
+    daily_ingestion['date'] = daily_ingestion['date'].astype(str)
+
+    source_counts = records_df['source'].value_counts().reset_index()
+    source_counts.columns = ['source', 'count']
+
+    return daily_ingestion, source_counts, len(records_df), records_df['date'].max()
+
+
+def _records_aggregates(path):
+    """
+    Aggregate all_records.csv for the dashboard.
+
+    Returns (daily_ingestion, source_counts, total_records, latest_date).
+    Uses a single fused Polars scan when available, pandas otherwise.
+    """
+    if POLARS_AVAILABLE:
+        return _records_aggregates_polars(path)
+    return _records_aggregates_pandas(path)
+
+
 def generate_dashboard_data():
     """Generate comprehensive dashboard visualizations"""
     
     # Load data
-    clusters_df = pd.read_csv(PROCESSED_DIR / "eligible_clusters.csv")
-    records_df = pd.read_csv(PROCESSED_DIR / "all_records.csv")
+    clusters_df = _read_csv(
+        PROCESSED_DIR / "eligible_clusters.csv", ['earliest_date', 'latest_date']
+    )
+    daily_ingestion, source_counts, total_records, latest_record_date = _records_aggregates(
+        PROCESSED_DIR / "all_records.csv"
+    )
     
-    records_df['date'] = pd.to_datetime(records_df['date'])
-    clusters_df['earliest_date'] = pd.to_datetime(clusters_df['earliest_date'])
-    clusters_df['latest_date'] = pd.to_datetime(clusters_df['latest_date'])
+    # Advanced analytics feed sections 5 and 8; load it once
+    analytics = None
+    analytics_path = BUILD_DIR / "exports" / "advanced_analytics.json"
+    if analytics_path.exists():
+        analytics_bytes = analytics_path.read_bytes()
+        analytics = orjson.loads(analytics_bytes) if ORJSON_AVAILABLE else json.loads(analytics_bytes)
     
     dashboard = {}
     
     # 1. Ingestion Performance Over Time
-    daily_ingestion = records_df.groupby(records_df['date'].dt.date).agg({
-        'id': 'count',
-        'source': 'nunique'
-    }).reset_index()
-    daily_ingestion.columns = ['date', 'records', 'sources']
-    daily_ingestion['date'] = daily_ingestion['date'].astype(str)
-    
     dashboard['ingestion_performance'] = {
         'title': 'Data Ingestion Rate',
         'type': 'line',
@@ -45,9 +176,6 @@ def generate_dashboard_data():
     }
     
     # 2. Source Distribution
-    source_counts = records_df['source'].value_counts().reset_index()
-    source_counts.columns = ['source', 'count']
-    
     dashboard['source_distribution'] = {
         'title': 'Data Sources',
         'type': 'pie',
@@ -82,15 +210,11 @@ def generate_dashboard_data():
     # 4. Cluster Size Distribution
     size_bins = [1, 2, 3, 5, 10, 20, float('inf')]
     size_labels = ['1-2', '2-3', '3-5', '5-10', '10-20', '20+']
-    clusters_df['size_category'] = pd.cut(
-        clusters_df['size'], 
-        bins=size_bins, 
-        labels=size_labels,
-        right=False
-    )
-    size_dist = clusters_df['size_category'].value_counts().reset_index()
-    size_dist.columns = ['size_range', 'count']
-    size_dist = size_dist.sort_values('size_range')
+    # Counts come back in bin order, which is the order the chart wants
+    size_dist = pd.DataFrame({
+        'size_range': size_labels,
+        'count': _bin_counts(clusters_df['size'], size_bins, len(size_labels), right=False),
+    })
     
     dashboard['cluster_size_distribution'] = {
         'title': 'Cluster Size Distribution',
@@ -104,25 +228,17 @@ def generate_dashboard_data():
     }
     
     # 5. Confidence Score Distribution
-    # Load advanced analytics
-    analytics_path = BUILD_DIR / "exports" / "advanced_analytics.json"
-    if analytics_path.exists():
-        with open(analytics_path) as f:
-            analytics = json.load(f)
-            
+    if analytics is not None:
         confidence_data = analytics['performance_metrics']['confidence_scores']['clusters']
         confidence_df = pd.DataFrame(confidence_data)
         
         # Bin confidence scores
         conf_bins = [0, 0.3, 0.5, 0.7, 0.9, 1.0]
         conf_labels = ['Low', 'Moderate-Low', 'Moderate', 'Moderate-High', 'High']
-        confidence_df['confidence_category'] = pd.cut(
-            confidence_df['confidence'],
-            bins=conf_bins,
-            labels=conf_labels
-        )
-        conf_dist = confidence_df['confidence_category'].value_counts().reset_index()
-        conf_dist.columns = ['confidence_level', 'count']
+        conf_dist = pd.DataFrame({
+            'confidence_level': conf_labels,
+            'count': _bin_counts(confidence_df['confidence'], conf_bins, len(conf_labels)),
+        }).sort_values('count', ascending=False, kind='stable')
         
         dashboard['confidence_distribution'] = {
             'title': 'Cluster Confidence Scores',
@@ -137,16 +253,16 @@ def generate_dashboard_data():
         }
     
     # 6. Geographic Spread
-    zip_counts = clusters_df['primary_zip'].value_counts().reset_index()
-    zip_counts.columns = ['zip', 'clusters']
-    zip_counts['zip'] = zip_counts['zip'].apply(lambda x: str(int(x)).zfill(5))
-    
-    # Calculate signal density
-    zip_signals = clusters_df.groupby('primary_zip')['size'].sum().reset_index()
-    zip_signals.columns = ['zip', 'total_signals']
-    zip_signals['zip'] = zip_signals['zip'].apply(lambda x: str(int(x)).zfill(5))
-    
-    geo_data = pd.merge(zip_counts, zip_signals, on='zip')
+    # Cluster count and signal density per ZIP in a single groupby
+    geo_data = (
+        clusters_df.groupby('primary_zip')['size']
+        .agg(clusters='count', total_signals='sum')
+        .reset_index()
+    )
+    geo_data['zip'] = geo_data['primary_zip'].astype('int32').astype(str).str.zfill(5)
+    geo_data = geo_data[['zip', 'clusters', 'total_signals']].sort_values(
+        'clusters', ascending=False, kind='stable'
+    )
     
     dashboard['geographic_distribution'] = {
         'title': 'Geographic Distribution by ZIP',
@@ -159,11 +275,11 @@ def generate_dashboard_data():
     }
     
     # 7. Strength vs Size Scatter
-    scatter_data = clusters_df[['cluster_id', 'size', 'volume_score']].copy()
-    scatter_data['days_old'] = (
-        datetime.utcnow() - clusters_df['latest_date']
-    ).dt.days
-    scatter_data = scatter_data[scatter_data['days_old'] <= 30]  # Last 30 days
+    # Filter to the last 30 days before copying the columns out
+    now = np.datetime64(datetime.utcnow())
+    days_old = (now - clusters_df['latest_date'].values.astype('datetime64[ns]')).astype('timedelta64[D]')
+    recent = days_old <= np.timedelta64(30, 'D')
+    scatter_data = clusters_df.loc[recent, ['cluster_id', 'size', 'volume_score']].copy()
     
     dashboard['strength_size_correlation'] = {
         'title': 'Cluster Strength vs Size',
@@ -175,7 +291,7 @@ def generate_dashboard_data():
     }
     
     # 8. Velocity & Prediction
-    if analytics_path.exists():
+    if analytics is not None:
         velocity_data = analytics['predictive_analytics'].get('velocity_trend', {})
         
         dashboard['velocity_prediction'] = {
@@ -190,12 +306,11 @@ def generate_dashboard_data():
         }
     
     # 9. System Health Score
-    total_records = len(records_df)
     total_clusters = len(clusters_df)
     clustering_rate = total_clusters / max(1, total_records) * 100
     
     # Data freshness (hours since last record)
-    hours_since_last = (datetime.utcnow() - records_df['date'].max()).total_seconds() / 3600
+    hours_since_last = (datetime.utcnow() - latest_record_date).total_seconds() / 3600
     freshness_score = max(0, min(100, 100 - (hours_since_last / 24 * 100)))
     
     # Overall health
@@ -219,11 +334,17 @@ def generate_dashboard_data():
     
     # Export
     output_path = BUILD_DIR / "data" / "analytics_dashboard.json"
-    with open(output_path, 'w') as f:
-        json.dump({
-            'generated_at': datetime.utcnow().isoformat(),
-            'dashboard': dashboard
-        }, f, indent=2)
+    payload = {
+        'generated_at': datetime.utcnow().isoformat(),
+        'dashboard': dashboard
+    }
+    if ORJSON_AVAILABLE:
+        output_path.write_bytes(orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(payload, f, indent=2)
     
     print(f"✓ Dashboard data exported to: {output_path}")
     print(f"\n📊 Dashboard Summary:")
@@ -19,16 +19,31 @@ Pipeline integration:
 """
 from __future__ import annotations
 
-import hashlib
+import atexit
+import itertools
 import json
 import logging
 import os
+import pickle
+import secrets
 import threading
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from processing.io_utils import HAS_WRITEV, writev_all
+except ImportError:
+    from io_utils import HAS_WRITEV, writev_all
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -38,6 +53,9 @@ LINEAGE_DIR = Path(__file__).parent.parent / "data" / "logs"
 LINEAGE_DIR.mkdir(parents=True, exist_ok=True)
 LINEAGE_FILE = LINEAGE_DIR / "lineage.jsonl"
 
+# Appends are buffered in-process; flush at most this often (seconds)
+FLUSH_INTERVAL_S = 1.0
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -60,10 +78,54 @@ VALID_STAGES = frozenset({
 })
 
 
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _dumps(obj: dict) -> bytes:
+    """Serialise one event to a JSON line (bytes, newline-terminated)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str) + b"\n"
+    return (json.dumps(obj, default=str) + "\n").encode("utf-8")
+
+
+# Event IDs: 8 hex chars of per-process prefix (PID + random salt, so IDs
+# stay distinct across runs that reuse a PID) + 8 hex chars of counter.
+def _seed_event_ids() -> None:
+    """Pick this process's event-ID prefix and restart the counter."""
+    global _EVENT_ID_PREFIX, _EVENT_COUNTER
+    _EVENT_ID_PREFIX = f"{os.getpid() & 0xFFFF:04x}{secrets.randbits(16):04x}"
+    _EVENT_COUNTER = itertools.count()
+
+
+_seed_event_ids()
+# Forked workers inherit the parent's prefix; give each child its own
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_seed_event_ids)
+
+
 def _generate_event_id() -> str:
-    """Unique event ID based on timestamp + entropy."""
-    raw = f"{time.time_ns()}-{os.getpid()}-{threading.get_ident()}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    """Unique 16-hex-char event ID from a process prefix and a counter."""
+    return f"{_EVENT_ID_PREFIX}{next(_EVENT_COUNTER) & 0xFFFFFFFF:08x}"
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_TS_PREFIX: tuple[int, str] = (-1, "")
+
+
+def _format_ns(timestamp_ns: int) -> str:
+    """UTC ISO-8601 string for ``timestamp_ns``, as ``datetime.isoformat()`` gives.
+
+    Events arrive many per second, so the date/time part is built at most
+    once a second and only the microseconds are formatted per call.
+    """
+    global _TS_PREFIX
+    secs, ns = divmod(timestamp_ns, 1_000_000_000)
+    second, prefix = _TS_PREFIX
+    if secs != second:
+        prefix = datetime.fromtimestamp(secs, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _TS_PREFIX = (secs, prefix)
+    us = ns // 1000
+    return f"{prefix}.{us:06d}+00:00" if us else f"{prefix}+00:00"
 
 
 # ---------------------------------------------------------------------------
@@ -73,7 +135,7 @@ def _generate_event_id() -> str:
 class LineageEvent:
     """Immutable record of a single transformation step."""
 
-    __slots__ = ("event_id", "record_id", "stage", "timestamp", "extras")
+    __slots__ = ("event_id", "record_id", "stage", "timestamp_ns", "extras")
 
     def __init__(
         self,
@@ -84,17 +146,26 @@ class LineageEvent:
         self.event_id = _generate_event_id()
         self.record_id = str(record_id)
         self.stage = stage
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        self.timestamp_ns = time.time_ns()
         self.extras = extras or {}
 
+    @property
+    def timestamp(self) -> str:
+        """UTC ISO-8601 timestamp, formatted on demand from ``timestamp_ns``."""
+        return _format_ns(self.timestamp_ns)
+
     def to_dict(self) -> dict:
-        return {
+        # extras may be shared across a batch, so it is copied in rather than
+        # reused; update() skips the literal's ** re-hash when it is empty
+        d = {
             "event_id": self.event_id,
             "record_id": self.record_id,
             "stage": self.stage,
             "timestamp": self.timestamp,
-            **self.extras,
         }
+        if self.extras:
+            d.update(self.extras)
+        return d
 
 
 # ---------------------------------------------------------------------------
@@ -105,15 +176,27 @@ class LineageTracker:
     """
     Append-only lineage recorder.
 
-    Thread-safe via a simple lock on file writes.
+    Thread-safe via a simple lock held across index updates and file writes.  Events are written
+    through a single buffered append handle that is flushed periodically,
+    on ``flush()``/``close()``, and at interpreter exit.
     """
 
     def __init__(self, lineage_file: Path | None = None):
         self._path = lineage_file or LINEAGE_FILE
+        # Pickled indexes keyed on (size, mtime_ns); any append invalidates it
+        self._cache_path = self._path.with_suffix(".jsonl.idx")
         self._lock = threading.Lock()
+        self._fh = None
+        self._last_flush = 0.0
         # In-memory index: record_id → list of events (for fast chain lookup)
         self._index: dict[str, list[dict]] = {}
+        # Secondary index: stage → list of events (for stage queries)
+        self._stage_index: dict[str, list[dict]] = {}
+        # Running totals so summary() does not have to walk the indexes
+        self._stage_counts: Counter[str] = Counter()
+        self._total_events = 0
         self._load_existing()
+        atexit.register(self.close)
 
     # ----- persistence -----
 
@@ -122,26 +205,109 @@ class LineageTracker:
         if not self._path.exists():
             return
         try:
-            with open(self._path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+            # stat before reading: appends racing the read only make the
+            # cached key older than the content, never newer
+            st = self._path.stat()
+            cache_key = (st.st_size, st.st_mtime_ns)
+            if self._load_index_cache(cache_key):
+                return
+
+            lines = [ln for ln in self._path.read_bytes().splitlines() if ln.strip()]
+            try:
+                # Fast path: parse the whole file as one JSON array in C
+                events = _loads(b"[" + b",".join(lines) + b"]")
+            except ValueError:
+                # Slow path: a corrupt or truncated line — skip it
+                events = []
+                for line in lines:
                     try:
-                        evt = json.loads(line)
-                        rid = evt.get("record_id", "")
-                        self._index.setdefault(rid, []).append(evt)
-                    except json.JSONDecodeError:
+                        events.append(_loads(line))
+                    except ValueError:
                         continue
-            logger.debug("Loaded %d lineage records from %s",
-                         sum(len(v) for v in self._index.values()), self._path)
+            for evt in events:
+                self._index_event(evt)
+            logger.debug("Loaded %d lineage records from %s", len(events), self._path)
+            self._save_index_cache(cache_key)
         except Exception as exc:
             logger.warning("Could not load lineage file: %s", exc)
 
-    def _append(self, evt_dict: dict) -> None:
+    def _load_index_cache(self, cache_key: tuple[int, int]) -> bool:
+        """Restore the indexes from the sidecar cache if it matches the file."""
+        if not self._cache_path.exists():
+            return False
+        try:
+            cached = pickle.loads(self._cache_path.read_bytes())
+        except Exception as exc:
+            logger.debug("Ignoring unreadable lineage index cache: %s", exc)
+            return False
+        if cached.get("key") != cache_key:
+            return False
+        self._index = cached["index"]
+        self._stage_index = cached["stage_index"]
+        self._stage_counts = Counter({s: len(v) for s, v in self._stage_index.items()})
+        self._total_events = sum(self._stage_counts.values())
+        logger.debug("Loaded %d lineage records from cache %s",
+                     self._total_events, self._cache_path)
+        return True
+
+    def _save_index_cache(self, cache_key: tuple[int, int]) -> None:
+        """Persist the freshly parsed indexes, keyed on the file's size/mtime."""
+        payload = {"key": cache_key, "index": self._index, "stage_index": self._stage_index}
+        tmp = self._cache_path.with_name(self._cache_path.name + ".tmp")
+        try:
+            tmp.write_bytes(pickle.dumps(payload, protocol=5))
+            os.replace(tmp, self._cache_path)
+        except OSError as exc:
+            logger.debug("Could not write lineage index cache: %s", exc)
+
+    def _index_event(self, evt: dict) -> None:
+        """Add an event to the record and stage indexes."""
+        stage = evt.get("stage", "unknown")
+        self._index.setdefault(evt.get("record_id", ""), []).append(evt)
+        self._stage_index.setdefault(stage, []).append(evt)
+        self._stage_counts[stage] += 1
+        self._total_events += 1
+
+    def _handle(self):
+        """Return the append handle, opening it on first use (lock held)."""
+        if self._fh is None:
+            fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._fh = os.fdopen(fd, "ab", buffering=65536)
+        return self._fh
+
+    def _write(self, blob: bytes) -> None:
+        """Append one or more serialised lines (lock held)."""
+        fh = self._handle()
+        fh.write(blob)
+        now = time.monotonic()
+        if now - self._last_flush >= FLUSH_INTERVAL_S:
+            fh.flush()
+            self._last_flush = now
+
+    def _writev(self, bufs: list[bytes]) -> None:
+        """Append many serialised lines, handing them to the kernel with writev (lock held)."""
+        if not HAS_WRITEV:
+            self._write(b"".join(bufs))
+            return
+        fh = self._handle()
+        # Anything still in the buffered handle must land first
+        fh.flush()
+        writev_all(fh.fileno(), bufs)
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Push buffered events to the lineage file."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+                self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the append handle (reopened on next write)."""
         with self._lock:
-            with open(self._path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(evt_dict, default=str) + "\n")
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
     # ----- public API -----
 
@@ -172,8 +338,11 @@ class LineageTracker:
 
         evt = LineageEvent(record_id=record_id, stage=stage, extras=extras)
         d = evt.to_dict()
-        self._index.setdefault(record_id, []).append(d)
-        self._append(d)
+        blob = _dumps(d)
+        # Indexes, running counters and the file change together under the lock
+        with self._lock:
+            self._index_event(d)
+            self._write(blob)
         return evt
 
     def record_batch(
@@ -183,37 +352,44 @@ class LineageTracker:
         **shared_extras: Any,
     ) -> int:
         """Record the same stage for many records at once."""
-        count = 0
-        for rid in record_ids:
-            self.record(stage, rid, **shared_extras)
-            count += 1
-        return count
+        if stage not in VALID_STAGES:
+            logger.warning("Unknown lineage stage '%s' — recording anyway.", stage)
+
+        events = [
+            LineageEvent(record_id=rid, stage=stage, extras=shared_extras).to_dict()
+            for rid in record_ids
+        ]
+        if not events:
+            return 0
+
+        bufs = [_dumps(d) for d in events]
+        with self._lock:
+            # Every event shares one stage: touch the stage index and
+            # counters once per batch rather than once per event
+            for d in events:
+                self._index.setdefault(d["record_id"], []).append(d)
+            self._stage_index.setdefault(stage, []).extend(events)
+            self._stage_counts[stage] += len(events)
+            self._total_events += len(events)
+            self._writev(bufs)
+        return len(events)
 
     def get_chain(self, record_id: str) -> list[dict]:
         """Return the full lineage chain for a record, ordered by timestamp."""
-        events = self._index.get(str(record_id), [])
-        return sorted(events, key=lambda e: e.get("timestamp", ""))
+        # events are monotonic per record_id by construction: they are
+        # indexed in file order on load and appended in order thereafter
+        return list(self._index.get(str(record_id), ()))
 
     def get_stage_records(self, stage: str) -> list[dict]:
         """Return all lineage events for a given stage."""
-        out = []
-        for events in self._index.values():
-            for e in events:
-                if e.get("stage") == stage:
-                    out.append(e)
-        return out
+        return list(self._stage_index.get(stage, ()))
 
     def summary(self) -> dict:
         """Return a summary of the lineage store."""
-        total = sum(len(v) for v in self._index.values())
-        stage_counts: dict[str, int] = {}
-        for events in self._index.values():
-            for e in events:
-                stage_counts[e.get("stage", "unknown")] = stage_counts.get(e.get("stage", "unknown"), 0) + 1
         return {
-            "total_events": total,
+            "total_events": self._total_events,
             "unique_records": len(self._index),
-            "stages": stage_counts,
+            "stages": dict(self._stage_counts),
             "lineage_file": str(self._path),
         }
 
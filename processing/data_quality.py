@@ -5,9 +5,17 @@ COVID-dashboard-style quality flags for public attention tracking data.
 
 from enum import Enum
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+import functools
+import heapq
+import html
 import os
 import json
+import sys
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11
+_PY311 = sys.version_info >= (3, 11)
 
 
 class DataQualityFlag(Enum):
@@ -21,26 +29,52 @@ class DataQualityFlag(Enum):
     @property
     def icon(self) -> str:
         """Get Unicode icon for this flag."""
-        icons = {
-            DataQualityFlag.COMPLETE: "✓",
-            DataQualityFlag.DELAYED: "⏱",
-            DataQualityFlag.INCOMPLETE: "⚠",
-            DataQualityFlag.SPARSE: "◔",
-            DataQualityFlag.STALE: "⨯"
-        }
-        return icons[self]
+        return self._ICONS[self]
     
     @property
     def color(self) -> str:
         """Get color code for this flag."""
-        colors = {
-            DataQualityFlag.COMPLETE: "green",
-            DataQualityFlag.DELAYED: "yellow",
-            DataQualityFlag.INCOMPLETE: "orange",
-            DataQualityFlag.SPARSE: "orange",
-            DataQualityFlag.STALE: "red"
-        }
-        return colors[self]
+        return self._COLORS[self]
+
+
+# Lookup tables for the properties above. Assigned after the class body so
+# Enum does not turn them into members.
+DataQualityFlag._ICONS = {
+    DataQualityFlag.COMPLETE: "✓",
+    DataQualityFlag.DELAYED: "⏱",
+    DataQualityFlag.INCOMPLETE: "⚠",
+    DataQualityFlag.SPARSE: "◔",
+    DataQualityFlag.STALE: "⨯"
+}
+DataQualityFlag._COLORS = {
+    DataQualityFlag.COMPLETE: "green",
+    DataQualityFlag.DELAYED: "yellow",
+    DataQualityFlag.INCOMPLETE: "orange",
+    DataQualityFlag.SPARSE: "orange",
+    DataQualityFlag.STALE: "red"
+}
+
+
+# Sentinel for article keys that are absent (as opposed to None)
+_MISSING = object()
+
+# Per-flag result prototypes; assessments copy one and add the cluster fields
+_PROTO = {
+    flag: {'flag': flag, 'icon': flag.icon, 'color': flag.color}
+    for flag in DataQualityFlag
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_feeds_config(config_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse the RSS feeds configuration file.
+    
+    Cached per (path, mtime) so a report over many clusters parses the
+    file once, while edits to the file are still picked up.
+    """
+    with open(config_file, 'r') as f:
+        return json.load(f)
 
 
 def get_expected_sources_for_zip(zip_code: str, config_path: str = "data/rss_feeds.json") -> List[str]:
@@ -52,30 +86,59 @@ def get_expected_sources_for_zip(zip_code: str, config_path: str = "data/rss_fee
         config_path: Path to RSS feeds configuration file
         
     Returns:
-        List of source identifiers (RSS feed URLs or source names)
+        List of source identifiers (RSS feed URLs or source names).
+        The list is shared with the config cache and must not be mutated.
     """
     config_file = os.path.join(os.path.dirname(__file__), '..', config_path)
     
-    if not os.path.exists(config_file):
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+    except OSError:
         # Return empty list if config doesn't exist
         return []
     
     try:
-        with open(config_file, 'r') as f:
-            feeds_config = json.load(f)
+        feeds_config = _load_feeds_config(config_file, mtime_ns)
         
         # Get feeds for this ZIP or use general feeds
-        if 'by_zip' in feeds_config and zip_code in feeds_config['by_zip']:
-            return feeds_config['by_zip'][zip_code]
-        elif 'general' in feeds_config:
-            return feeds_config['general']
-        else:
-            return []
+        return feeds_config.get('by_zip', {}).get(zip_code) or feeds_config.get('general', [])
     except Exception as e:
         print(f"Warning: Could not load RSS feed config: {e}")
         return []
 
 
+@functools.lru_cache(maxsize=65536)
+def _parse_published_str(published: str) -> Optional[datetime]:
+    """
+    Parse an ISO 'published' string; None if it is unparseable.
+    
+    Memoized because the same articles are re-assessed on every report run.
+    """
+    if not _PY311 and published.endswith('Z'):
+        published = published[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(published)
+    except ValueError:
+        return None
+
+
+def _parse_published(published: Any) -> Optional[datetime]:
+    """Parse an article's 'published' value; None if it is unparseable."""
+    if not isinstance(published, str):
+        return published
+    return _parse_published_str(published)
+
+
+def _latest_published(published_values: List[Any]) -> Optional[datetime]:
+    """Return the most recent parseable 'published' value, or None."""
+    most_recent = None
+    for published in published_values:
+        ts = _parse_published(published)
+        if ts is not None and (most_recent is None or ts > most_recent):
+            most_recent = ts
+    return most_recent
+
+
 def assess_cluster_data_quality(
     cluster: Dict[str, Any],
     expected_sources: Optional[List[str]] = None
@@ -100,138 +163,165 @@ def assess_cluster_data_quality(
         - details: Dict with specific metrics
         - severity: int (0=good, 4=critical)
     """
-    now = datetime.now()
-    
-    # Extract cluster metadata
+    return _assess_cluster_data_quality(cluster, expected_sources, datetime.now())
+
+
+def _compute_metrics(
+    cluster: Dict[str, Any],
+    expected_sources: Optional[List[str]],
+    now: datetime
+) -> Tuple[Optional[float], int, int, int]:
+    """Return (hours_since_update, num_sources, num_articles, num_expected)."""
     articles = cluster.get('articles', [])
-    zip_code = cluster.get('zip', '')
     
     # Get expected sources if not provided
     if expected_sources is None:
-        expected_sources = get_expected_sources_for_zip(zip_code)
-    
-    # Calculate metrics
-    num_sources = len(set(article.get('source', '') for article in articles if article.get('source')))
-    num_articles = len(articles)
-    
-    # Get most recent article timestamp
-    most_recent = None
-    if articles:
-        timestamps = []
-        for article in articles:
-            if 'published' in article:
-                try:
-                    if isinstance(article['published'], str):
-                        ts = datetime.fromisoformat(article['published'].replace('Z', '+00:00'))
-                    else:
-                        ts = article['published']
-                    timestamps.append(ts)
-                except:
-                    continue
-        
-        if timestamps:
-            most_recent = max(timestamps)
+        expected_sources = get_expected_sources_for_zip(cluster.get('zip', ''))
+    
+    # Calculate metrics and collect publish times in one pass
+    sources = set()
+    published_values = []
+    for article in articles:
+        source = article.get('source')
+        if source:
+            sources.add(source)
+        published = article.get('published', _MISSING)
+        if published is not _MISSING:
+            published_values.append(published)
+    most_recent = _latest_published(published_values)
     
     # Calculate time since last update
     hours_since_update = None
     if most_recent:
         hours_since_update = (now - most_recent).total_seconds() / 3600
     
-    # Assess quality based on priority order
+    num_expected = len(expected_sources) if expected_sources else 0
+    return hours_since_update, len(sources), len(articles), num_expected
+
+
+def _classify(metrics: Tuple[Optional[float], int, int, int]) -> Tuple[DataQualityFlag, int]:
+    """Map assessment metrics to (flag, severity) in priority order."""
+    hours_since_update, num_sources, _, num_expected = metrics
     
     # 1. STALE: No updates in 7+ days (168 hours)
-    if most_recent is None or hours_since_update >= 168:
-        return {
-            'flag': DataQualityFlag.STALE,
-            'icon': DataQualityFlag.STALE.icon,
-            'color': DataQualityFlag.STALE.color,
-            'message': 'No recent public attention detected',
-            'details': {
-                'hours_since_update': hours_since_update,
-                'num_sources': num_sources,
-                'num_articles': num_articles,
-                'expected_sources': len(expected_sources),
-                'note': 'Public RSS feeds may not be actively monitoring this area'
-            },
-            'severity': 4
-        }
+    if hours_since_update is None or hours_since_update >= 168:
+        return DataQualityFlag.STALE, 4
     
     # 2. INCOMPLETE: Missing >50% expected sources
-    if expected_sources and num_sources < len(expected_sources) * 0.5:
-        missing_pct = int((1 - num_sources / len(expected_sources)) * 100)
-        return {
-            'flag': DataQualityFlag.INCOMPLETE,
-            'icon': DataQualityFlag.INCOMPLETE.icon,
-            'color': DataQualityFlag.INCOMPLETE.color,
-            'message': f'Limited source coverage ({missing_pct}% sources not reporting)',
-            'details': {
+    if num_expected and num_sources < num_expected * 0.5:
+        return DataQualityFlag.INCOMPLETE, 2
+    
+    # 3. SPARSE: <2 sources in area
+    if num_sources < 2:
+        return DataQualityFlag.SPARSE, 2
+    
+    # 4. DELAYED: Data 48+ hours old
+    if hours_since_update >= 48:
+        return DataQualityFlag.DELAYED, 1
+    
+    # 5. COMPLETE: All good
+    return DataQualityFlag.COMPLETE, 0
+
+
+def _build_full_result(
+    flag: DataQualityFlag,
+    severity: int,
+    metrics: Tuple[Optional[float], int, int, int]
+) -> Dict[str, Any]:
+    """Build the message and details for a classified cluster."""
+    hours_since_update, num_sources, num_articles, num_expected = metrics
+    result = _PROTO[flag].copy()
+    
+    if flag is DataQualityFlag.STALE:
+        result.update(
+            message='No recent public attention detected',
+            details={
                 'hours_since_update': hours_since_update,
                 'num_sources': num_sources,
-                'expected_sources': len(expected_sources),
-                'coverage_pct': int((num_sources / len(expected_sources)) * 100),
                 'num_articles': num_articles,
-                'note': 'Some configured RSS feeds have no recent articles for this area'
+                'expected_sources': num_expected,
+                'note': 'Public RSS feeds may not be actively monitoring this area'
             },
-            'severity': 2
-        }
-    
-    # 3. SPARSE: <2 sources in area
-    if num_sources < 2:
-        return {
-            'flag': DataQualityFlag.SPARSE,
-            'icon': DataQualityFlag.SPARSE.icon,
-            'color': DataQualityFlag.SPARSE.color,
-            'message': 'Minimal source coverage',
-            'details': {
+            severity=severity
+        )
+    elif flag is DataQualityFlag.INCOMPLETE:
+        coverage = num_sources / num_expected
+        missing_pct = int((1 - coverage) * 100)
+        result.update(
+            message=f'Limited source coverage ({missing_pct}% sources not reporting)',
+            details={
                 'hours_since_update': hours_since_update,
                 'num_sources': num_sources,
+                'expected_sources': num_expected,
+                'coverage_pct': int(coverage * 100),
                 'num_articles': num_articles,
-                'expected_sources': len(expected_sources) if expected_sources else 'unknown',
-                'note': 'Public attention tracking inherently limited by available RSS feeds'
+                'note': 'Some configured RSS feeds have no recent articles for this area'
             },
-            'severity': 2
-        }
-    
-    # 4. DELAYED: Data 48+ hours old
-    if hours_since_update >= 48:
-        return {
-            'flag': DataQualityFlag.DELAYED,
-            'icon': DataQualityFlag.DELAYED.icon,
-            'color': DataQualityFlag.DELAYED.color,
-            'message': f'Data delayed by {int(hours_since_update)} hours',
-            'details': {
+            severity=severity
+        )
+    else:
+        if flag is DataQualityFlag.SPARSE:
+            message = 'Minimal source coverage'
+            note = 'Public attention tracking inherently limited by available RSS feeds'
+        elif flag is DataQualityFlag.DELAYED:
+            message = f'Data delayed by {int(hours_since_update)} hours'
+            note = 'RSS feed updates may be delayed; does not indicate data loss'
+        else:
+            message = 'Good source coverage'
+            note = 'Recent articles from multiple public sources'
+        result.update(
+            message=message,
+            details={
                 'hours_since_update': hours_since_update,
                 'num_sources': num_sources,
                 'num_articles': num_articles,
-                'expected_sources': len(expected_sources) if expected_sources else 'unknown',
-                'note': 'RSS feed updates may be delayed; does not indicate data loss'
+                'expected_sources': num_expected or 'unknown',
+                'note': note
             },
-            'severity': 1
-        }
-    
-    # 5. COMPLETE: All good
+            severity=severity
+        )
+    return result
+
+
+def _assess_cluster_data_quality(
+    cluster: Dict[str, Any],
+    expected_sources: Optional[List[str]],
+    now: datetime
+) -> Dict[str, Any]:
+    """assess_cluster_data_quality with the reference time passed in."""
+    metrics = _compute_metrics(cluster, expected_sources, now)
+    flag, severity = _classify(metrics)
+    return _build_full_result(flag, severity, metrics)
+
+
+def _severity_key(cluster_info: Dict[str, Any]) -> int:
+    return cluster_info['assessment']['severity']
+
+
+def _first(item: Tuple) -> Any:
+    return item[0]
+
+
+def _cluster_entry(cluster: Dict[str, Any], assessment: Dict[str, Any]) -> Dict[str, Any]:
+    """One row of a quality report: the cluster's location plus its assessment."""
     return {
-        'flag': DataQualityFlag.COMPLETE,
-        'icon': DataQualityFlag.COMPLETE.icon,
-        'color': DataQualityFlag.COMPLETE.color,
-        'message': 'Good source coverage',
-        'details': {
-            'hours_since_update': hours_since_update,
-            'num_sources': num_sources,
-            'num_articles': num_articles,
-            'expected_sources': len(expected_sources) if expected_sources else 'unknown',
-            'note': 'Recent articles from multiple public sources'
-        },
-        'severity': 0
+        'zip': cluster.get('zip', 'unknown'),
+        'location': cluster.get('location', 'Unknown'),
+        'assessment': assessment
     }
 
 
-def generate_quality_report(clusters: List[Dict[str, Any]]) -> Dict[str, Any]:
+def generate_quality_report(
+    clusters: List[Dict[str, Any]],
+    include_all: bool = True
+) -> Dict[str, Any]:
     """
     Generate summary quality report across all clusters.
     
     Args:
         clusters: List of cluster dictionaries
+        include_all: Include every assessment, sorted worst first, under
+                     'all_clusters'. Pass False to skip the full sort.
         
     Returns:
         Dict with:
@@ -239,6 +329,7 @@ def generate_quality_report(clusters: List[Dict[str, Any]]) -> Dict[str, Any]:
         - by_flag: Counts by quality flag
         - by_severity: Counts by severity level
         - worst_clusters: List of clusters with issues
+        - all_clusters: Every cluster assessment (only if include_all)
         - timestamp: Report generation time
     """
     if not clusters:
@@ -250,28 +341,42 @@ def generate_quality_report(clusters: List[Dict[str, Any]]) -> Dict[str, Any]:
             'timestamp': datetime.now().isoformat()
         }
     
-    flag_counts = {flag: 0 for flag in DataQualityFlag}
-    severity_counts = {i: 0 for i in range(5)}
+    flag_counts = Counter()
+    severity_counts = Counter()
     cluster_assessments = []
     
-    # Assess each cluster
-    for cluster in clusters:
-        assessment = assess_cluster_data_quality(cluster)
-        flag_counts[assessment['flag']] += 1
-        severity_counts[assessment['severity']] += 1
+    # Assess each cluster against a single reference time
+    now = datetime.now()
+    if include_all:
+        for cluster in clusters:
+            assessment = _assess_cluster_data_quality(cluster, None, now)
+            flag_counts[assessment['flag']] += 1
+            severity_counts[assessment['severity']] += 1
+            cluster_assessments.append(_cluster_entry(cluster, assessment))
         
-        cluster_assessments.append({
-            'zip': cluster.get('zip', 'unknown'),
-            'location': cluster.get('location', 'Unknown'),
-            'assessment': assessment
-        })
-    
-    # Sort by severity (worst first)
-    cluster_assessments.sort(key=lambda x: x['assessment']['severity'], reverse=True)
+        # Order by severity (worst first)
+        cluster_assessments.sort(key=_severity_key, reverse=True)
+        worst_clusters = cluster_assessments[:10]
+    else:
+        # Only flags and severities are counted; the full result (message
+        # and details) is built just for the top 10 picked by a heap select
+        classified = []
+        for cluster in clusters:
+            metrics = _compute_metrics(cluster, None, now)
+            flag, severity = _classify(metrics)
+            flag_counts[flag] += 1
+            severity_counts[severity] += 1
+            classified.append((severity, flag, metrics, cluster))
+        worst_clusters = [
+            _cluster_entry(cluster, _build_full_result(flag, severity, metrics))
+            for severity, flag, metrics, cluster in heapq.nlargest(10, classified, key=_first)
+        ]
     
     # Calculate overall health
     total = len(clusters)
-    complete_pct = (flag_counts[DataQualityFlag.COMPLETE] / total) * 100
+    inv_total = 100.0 / total
+    healthy_count = flag_counts[DataQualityFlag.COMPLETE]
+    complete_pct = healthy_count * inv_total
     
     if complete_pct >= 80:
         overall_status = "Healthy"
@@ -282,35 +387,51 @@ def generate_quality_report(clusters: List[Dict[str, Any]]) -> Dict[str, Any]:
     else:
         overall_status = "Sparse"
     
-    return {
+    report = {
         'summary': {
             'overall_status': overall_status,
             'total_clusters': total,
             'complete_pct': round(complete_pct, 1),
-            'healthy_count': flag_counts[DataQualityFlag.COMPLETE],
-            'issues_count': sum(flag_counts[flag] for flag in flag_counts if flag != DataQualityFlag.COMPLETE)
+            'healthy_count': healthy_count,
+            'issues_count': total - healthy_count
         },
         'by_flag': {
             flag.value: {
-                'count': flag_counts[flag],
-                'pct': round((flag_counts[flag] / total) * 100, 1),
+                'count': count,
+                'pct': round(count * inv_total, 1),
                 'icon': flag.icon,
                 'color': flag.color
             }
-            for flag in DataQualityFlag
+            for flag, count in ((flag, flag_counts[flag]) for flag in DataQualityFlag)
         },
         'by_severity': {
             severity: {
-                'count': severity_counts[severity],
-                'pct': round((severity_counts[severity] / total) * 100, 1)
+                'count': count,
+                'pct': round(count * inv_total, 1)
             }
-            for severity in range(5)
+            for severity, count in ((severity, severity_counts[severity]) for severity in range(5))
         },
-        'worst_clusters': cluster_assessments[:10],  # Top 10 worst
+        'worst_clusters': worst_clusters,  # Top 10 worst
         'all_clusters': cluster_assessments,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'disclaimer': 'Quality flags reflect RSS feed coverage, not ICE activity. Public attention tracking has inherent limitations.'
     }
+    if not include_all:
+        del report['all_clusters']
+    return report
+
+
+# One row of the worst-clusters table; cluster strings are escaped before filling
+_ROW_TMPL = """
+                <tr>
+                    <td>{icon}</td>
+                    <td>{location}</td>
+                    <td>{zip}</td>
+                    <td>{message}</td>
+                    <td>{sources}</td>
+                    <td>{hours}h ago</td>
+                </tr>
+"""
 
 
 def export_quality_report_html(report: Dict[str, Any], output_path: str) -> None:
@@ -321,7 +442,7 @@ def export_quality_report_html(report: Dict[str, Any], output_path: str) -> None
         report: Quality report from generate_quality_report()
         output_path: Path to write HTML file
     """
-    html = f"""<!DOCTYPE html>
+    header = f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -443,20 +564,7 @@ def export_quality_report_html(report: Dict[str, Any], output_path: str) -> None
             <tbody>
 """
     
-    for cluster_info in report['worst_clusters']:
-        assessment = cluster_info['assessment']
-        html += f"""
-                <tr>
-                    <td>{assessment['icon']}</td>
-                    <td>{cluster_info['location']}</td>
-                    <td>{cluster_info['zip']}</td>
-                    <td>{assessment['message']}</td>
-                    <td>{assessment['details']['num_sources']}</td>
-                    <td>{int(assessment['details'].get('hours_since_update', 0))}h ago</td>
-                </tr>
-"""
-    
-    html += f"""
+    footer = f"""
             </tbody>
         </table>
     </div>
@@ -468,8 +576,21 @@ def export_quality_report_html(report: Dict[str, Any], output_path: str) -> None
 </html>
 """
     
+    # Stream the rows straight to the file instead of growing one string
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+        f.write(header)
+        for cluster_info in report['worst_clusters']:
+            assessment = cluster_info['assessment']
+            details = assessment['details']
+            f.write(_ROW_TMPL.format_map({
+                'icon': assessment['icon'],
+                'location': html.escape(str(cluster_info['location'])),
+                'zip': html.escape(str(cluster_info['zip'])),
+                'message': html.escape(assessment['message']),
+                'sources': details['num_sources'],
+                'hours': int(details.get('hours_since_update') or 0),
+            }))
+        f.write(footer)
 
 
 if __name__ == '__main__':
@@ -13,12 +13,19 @@ Structure:
 - validation/: Geographic validation audit trail
 """
 import json
+import os
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, Dict, List
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config import BASE_DIR, TARGET_CITIES, ZIP_CENTROIDS
 
 TRACKING_DIR = BASE_DIR / "data" / "tracking"
@@ -26,32 +33,95 @@ EVENTS_DIR = TRACKING_DIR / "events"
 SOURCES_DIR = TRACKING_DIR / "sources"
 VALIDATION_DIR = TRACKING_DIR / "validation"
 
+# Coordinates recorded for ZIPs without a known centroid
+_DEFAULT_CENTROID = (0, 0)
+
 # Ensure tracking directories exist
 for _d in (TRACKING_DIR, EVENTS_DIR, SOURCES_DIR, VALIDATION_DIR):
     _d.mkdir(parents=True, exist_ok=True)
 
 
+def _dumps(obj) -> bytes:
+    """Serialize obj as indented JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize obj as one compact, newline-terminated JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode() + b"\n"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file, then os.replace it over path."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _loads(data):
+    """Parse JSON from str or bytes (orjson when available)."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
 class EventCatalog:
-    """Central catalog for all tracked events."""
+    """
+    Central catalog for all tracked events.
+    
+    Event summaries are appended to events.jsonl as they are added;
+    catalog.json only holds the version. The zip/city/date indexes are
+    derived from the events on first lookup.
+    """
     
     def __init__(self):
         self.catalog_path = TRACKING_DIR / "catalog.json"
+        self.events_jsonl = TRACKING_DIR / "events.jsonl"
+        self._events_fh = None
+        self._indexes = None  # {"zip"|"city"|"date": {value: [event_id, ...]}}
         self.load_catalog()
     
     def load_catalog(self):
         """Load existing catalog or create new."""
         if self.catalog_path.exists():
-            with open(self.catalog_path, 'r') as f:
-                self.catalog = json.load(f)
+            self.catalog = _loads(self.catalog_path.read_bytes())
         else:
             self.catalog = {
                 "version": "1.0",
                 "created": datetime.now(timezone.utc).isoformat(),
-                "events": [],
-                "index_by_zip": {},
-                "index_by_city": {},
-                "index_by_date": {},
             }
+        self._indexes = None
+        
+        # Older catalogs persisted the indexes and embedded the events
+        for key in ("index_by_zip", "index_by_city", "index_by_date"):
+            self.catalog.pop(key, None)
+        legacy_events = self.catalog.pop("events", None)
+        if self.events_jsonl.exists():
+            with open(self.events_jsonl, 'rb') as f:
+                self.catalog["events"] = [_loads(line) for line in f if line.strip()]
+        else:
+            self.catalog["events"] = legacy_events or []
+            if legacy_events:
+                _write_atomic(self.events_jsonl, b"".join(_dumps_line(e) for e in legacy_events))
+    
+    def _append_event_summary(self, summary: Dict) -> None:
+        """Append one event summary line to events.jsonl."""
+        if self._events_fh is None:
+            self._events_fh = open(self.events_jsonl, 'ab')
+        self._events_fh.write(_dumps_line(summary))
+    
+    def _index(self, field: str) -> Dict[str, List[str]]:
+        """Return the event_id index for an event field, building all indexes if stale."""
+        if self._indexes is None:
+            events = pd.DataFrame(self.catalog["events"], columns=["event_id", "zip", "city", "date"])
+            self._indexes = {
+                col: events.groupby(col, sort=False)["event_id"].agg(list).to_dict()
+                for col in ("zip", "city", "date")
+            }
+        return self._indexes[field]
     
     def add_event(
         self,
@@ -79,7 +149,7 @@ class EventCatalog:
             "location": {
                 "zip": zip_code,
                 "city": city,
-                "coordinates": ZIP_CENTROIDS.get(zip_code, (0, 0)),
+                "coordinates": ZIP_CENTROIDS.get(zip_code, _DEFAULT_CENTROID),
             },
             "summary": text[:300],
             "full_text": text,
@@ -93,51 +163,44 @@ class EventCatalog:
         
         # Save individual event file
         event_path = EVENTS_DIR / f"{event_id}.json"
-        with open(event_path, 'w') as f:
-            json.dump(event_record, f, indent=2)
+        with open(event_path, 'wb') as f:
+            f.write(_dumps(event_record))
         
         # Update main catalog
-        self.catalog["events"].append({
+        event_summary = {
             "event_id": event_id,
             "date": event_date,
             "zip": zip_code,
             "city": city,
             "source": source_feed,
             "file": str(event_path.relative_to(TRACKING_DIR)),
-        })
-        
-        # Update indexes
-        if zip_code not in self.catalog["index_by_zip"]:
-            self.catalog["index_by_zip"][zip_code] = []
-        self.catalog["index_by_zip"][zip_code].append(event_id)
-        
-        if city not in self.catalog["index_by_city"]:
-            self.catalog["index_by_city"][city] = []
-        self.catalog["index_by_city"][city].append(event_id)
-        
-        if event_date not in self.catalog["index_by_date"]:
-            self.catalog["index_by_date"][event_date] = []
-        self.catalog["index_by_date"][event_date].append(event_id)
+        }
+        self.catalog["events"].append(event_summary)
+        self._append_event_summary(event_summary)
+        self._indexes = None
         
         return str(event_path)
     
     def save(self):
-        """Save catalog to disk."""
-        with open(self.catalog_path, 'w') as f:
-            json.dump(self.catalog, f, indent=2)
+        """Close the events.jsonl handle and save the catalog header to disk."""
+        if self._events_fh is not None:
+            self._events_fh.close()  # reopened by the next add_event()
+            self._events_fh = None
+        header = {k: v for k, v in self.catalog.items() if k != "events"}
+        _write_atomic(self.catalog_path, _dumps(header))
         print(f"Catalog saved: {self.catalog_path}")
     
     def get_events_by_zip(self, zip_code: str) -> List[str]:
         """Quick lookup: all event IDs for a ZIP code."""
-        return self.catalog["index_by_zip"].get(zip_code, [])
+        return self._index("zip").get(zip_code, [])
     
     def get_events_by_city(self, city: str) -> List[str]:
         """Quick lookup: all event IDs for a city."""
-        return self.catalog["index_by_city"].get(city, [])
+        return self._index("city").get(city, [])
     
     def get_events_by_date(self, date: str) -> List[str]:
         """Quick lookup: all event IDs for a date."""
-        return self.catalog["index_by_date"].get(date, [])
+        return self._index("date").get(date, [])
 
 
 class SourceTracker:
@@ -183,8 +246,7 @@ class SourceTracker:
     def save(self):
         """Save tracker to disk."""
         self.tracker["last_updated"] = datetime.now(timezone.utc).isoformat()
-        with open(self.tracker_path, 'w') as f:
-            json.dump(self.tracker, f, indent=2)
+        _write_atomic(self.tracker_path, _dumps(self.tracker))
         print(f"Source tracker saved: {self.tracker_path}")
 
 
@@ -194,8 +256,11 @@ def generate_event_id(text: str, date: str, zip_code: str) -> str:
     
     Same event from different sources gets same ID for deduplication.
     """
-    hash_input = f"{text[:100]}{date}{zip_code}".encode()
-    return hashlib.md5(hash_input).hexdigest()[:12]
+    h = hashlib.blake2b(digest_size=6)
+    h.update(text[:100].encode())
+    h.update(date.encode())
+    h.update(zip_code.encode())
+    return h.hexdigest()
 
 
 def create_event_quick_link(event_id: str, city: str, zip_code: str) -> str:
@@ -215,19 +280,17 @@ def build_event_summary_csv(output_path: Optional[Path] = None) -> pd.DataFrame:
     """
     catalog = EventCatalog()
     
-    rows = []
-    for event in catalog.catalog["events"]:
-        rows.append({
-            "event_id": event["event_id"],
-            "event_date": event["date"],
-            "city": event["city"],
-            "zip": event["zip"],
-            "source_feed": event["source"],
-            "quick_link": create_event_quick_link(event["event_id"], event["city"], event["zip"]),
-            "event_file": event["file"],
-        })
+    df = pd.DataFrame(
+        catalog.catalog["events"],
+        columns=["event_id", "date", "city", "zip", "source", "file"],
+    ).rename(columns={"date": "event_date", "source": "source_feed", "file": "event_file"})
     
-    df = pd.DataFrame(rows)
+    # Same format as create_event_quick_link, built column-wise
+    df.insert(5, "quick_link", (
+        "/heat?event=" + df["event_id"].astype(str)
+        + "&city=" + df["city"].astype(str)
+        + "&zip=" + df["zip"].astype(str)
+    ))
     
     if output_path is None:
         output_path = TRACKING_DIR / "events_summary.csv"
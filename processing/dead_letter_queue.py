@@ -6,7 +6,21 @@ queue (DLQ) so that no data loss goes unnoticed.  Failed items are
 retried on subsequent pipeline runs (up to MAX_RETRIES), and permanently
 quarantined items are logged for manual review.
 
-Storage: ``data/logs/dead_letter_queue.jsonl`` (append-only JSONL).
+Storage is tiered, LSM-style, under ``data/logs/``:
+
+  - L0 ``dead_letter_queue.jsonl``: append-only hot log.  New items are
+    written as full records; later status changes append small delta
+    lines (``id`` plus the changed fields).
+  - L1 ``dead_letter_queue.l1.jsonl``: compacted snapshot, one line per
+    live item.
+  - Archive ``dead_letter_queue.archive.jsonl``: resolved items older
+    than ARCHIVE_AFTER, moved out so they are no longer rewritten.
+
+Loading reads L1 and replays L0 on top.  Compaction (on load when L0 is
+non-empty, on ``purge_resolved()`` / ``compact()``, or once deltas
+dominate L0) archives expired items, writes a fresh L1 and empties L0.
+With ``zstandard`` installed every file gets a ``.zst`` suffix and is
+written as one zstd frame per batch.
 
 Pipeline integration:
     from dead_letter_queue import DeadLetterQueue
@@ -26,16 +40,38 @@ Pipeline integration:
 """
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
+import mmap
 import os
+import queue
+import sys
 import threading
 import time
-from datetime import datetime, timezone
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    from processing.io_utils import HAS_WRITEV, writev_all
+except ImportError:
+    from io_utils import HAS_WRITEV, writev_all
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -44,6 +80,7 @@ logger = logging.getLogger(__name__)
 LOGS_DIR = Path(__file__).parent.parent / "data" / "logs"
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 DLQ_FILE = LOGS_DIR / "dead_letter_queue.jsonl"
+DLQ_ZST_FILE = LOGS_DIR / "dead_letter_queue.jsonl.zst"
 DLQ_SUMMARY_FILE = LOGS_DIR / "dlq_summary.json"
 
 # ---------------------------------------------------------------------------
@@ -57,11 +94,83 @@ STATUS_RETRYING = "retrying"
 STATUS_RESOLVED = "resolved"
 STATUS_QUARANTINED = "quarantined"
 
+# Fields a delta line may carry (everything else is fixed at creation)
+DELTA_FIELDS = ("status", "retries", "error", "updated_at")
+
+# Compact once the log holds this many lines per live item (plus slack)
+COMPACT_RATIO = 4
+COMPACT_MIN_LINES = 1000
+
+# Resolved items untouched for this long are moved to the archive tier
+ARCHIVE_AFTER = timedelta(days=7)
+
+# Background flusher: write buffered lines every interval, or sooner once
+# this many bytes are waiting
+FLUSH_INTERVAL_MS = 50
+BATCH_BYTES = 1 << 20
+
+ZSTD_LEVEL = 3
+
+# Plain logs at least this large are scanned through mmap instead of being
+# read and split in one go
+MMAP_MIN_BYTES = 64 << 20
+
+_STOP = object()  # writer-thread shutdown sentinel
+
+
+def _dumps_line(obj: dict) -> bytes:
+    """Serialize one compact, newline-terminated JSONL record."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, default=str) + "\n").encode("utf-8")
+
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Stdlib fallback for DLQItem.to_json_line: string fields are escaped with
+# json's C encoder and dropped into a fixed template (same keys as to_dict)
+_escape = json.encoder.encode_basestring_ascii
+_ITEM_LINE_TMPL = (
+    '{"id":%s,"source":%s,"url":%s,"error":%s,"status":%s,"retries":%d,'
+    '"created_at":%s,"updated_at":%s,"metadata":%s}\n'
+)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write until every byte of ``data`` has been written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 
 def _generate_id(source: str, url: str) -> str:
     """Deterministic ID from source + url so duplicates are de-duped."""
-    raw = f"{source}::{url}".encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()[:16]
+    return hashlib.blake2b(f"{source}::{url}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _tier_path(path: Path, tier: str) -> Path:
+    """Sibling file for a storage tier: ``dlq.jsonl.zst`` -> ``dlq.l1.jsonl.zst``."""
+    base, sep, ext = path.name.partition(".jsonl")
+    return path.with_name(f"{base}.{tier}{sep}{ext}")
+
+
+_TS_CACHE: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """UTC ISO timestamp for item mutations, re-formatted at most once a second."""
+    global _TS_CACHE
+    t = time.time()
+    second, stamp = _TS_CACHE
+    if int(t) != second:
+        stamp = datetime.fromtimestamp(t, timezone.utc).isoformat()
+        _TS_CACHE = (int(t), stamp)
+    return stamp
+
+
+def _intern(value):
+    """Intern ``value`` if it is a str; pass anything else (e.g. null) through."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 # ---------------------------------------------------------------------------
@@ -89,14 +198,18 @@ class DLQItem:
         updated_at: str | None = None,
     ):
         self.id = item_id or _generate_id(source, url)
-        self.source = source
+        # source/status/error repeat across thousands of items: share one object each
+        self.source = _intern(source)
         self.url = url
-        self.error = error
-        self.status = status
+        self.error = _intern(error)
+        self.status = _intern(status)
         self.retries = retries
-        self.created_at = created_at or datetime.now(timezone.utc).isoformat()
-        self.updated_at = updated_at or self.created_at
-        self.metadata = metadata or {}
+        self.created_at = created_at or _now_iso()
+        # An untouched item shares one timestamp string for both fields
+        if not updated_at or updated_at == self.created_at:
+            updated_at = self.created_at
+        self.updated_at = updated_at
+        self.metadata = metadata or None  # no empty dict per item; to_dict() fills in {}
 
     def to_dict(self) -> dict:
         return {
@@ -108,18 +221,32 @@ class DLQItem:
             "retries": self.retries,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
-            "metadata": self.metadata,
+            "metadata": self.metadata or {},
         }
 
+    def to_json_line(self) -> bytes:
+        """Serialize as one JSONL record (the ``to_dict`` shape)."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_APPEND_NEWLINE)
+        return (_ITEM_LINE_TMPL % (
+            _escape(self.id), _escape(self.source), _escape(self.url),
+            _escape(self.error or ""), _escape(self.status), self.retries,
+            _escape(self.created_at), _escape(self.updated_at),
+            json.dumps(self.metadata, default=str) if self.metadata else "{}",
+        )).encode("utf-8")
+
     @classmethod
     def from_dict(cls, d: dict) -> "DLQItem":
+        metadata = d.get("metadata")
+        if metadata:
+            metadata = {sys.intern(k): v for k, v in metadata.items()}
         return cls(
             source=d["source"],
             url=d["url"],
             error=d.get("error", ""),
             status=d.get("status", STATUS_PENDING),
             retries=d.get("retries", 0),
-            metadata=d.get("metadata"),
+            metadata=metadata,
             item_id=d.get("id"),
             created_at=d.get("created_at"),
             updated_at=d.get("updated_at"),
@@ -134,48 +261,360 @@ class DeadLetterQueue:
     """
     Persistent dead-letter queue backed by a JSONL file.
 
-    Thread-safe via a lock on mutations.
+    Log lines are handed to a ``queue.SimpleQueue`` and written in batches
+    by a single daemon writer thread, so callers never block on file I/O.
+    ``flush()`` waits until everything queued so far is on disk, and
+    ``close()`` runs automatically at interpreter exit.
+
+    ``dlq_file`` is the L0 log; the L1 snapshot and archive live next to
+    it (see the module docstring).  A ``.zst`` path is written as a sequence of independent zstd frames,
+    one per batch, so a crash mid-write only loses the torn last frame.
+    The default path is the ``.zst`` log when ``zstandard`` is available;
+    plain L0, L1 and archive files already on disk are migrated into their
+    ``.zst`` siblings on first load.
+
+    Pass ``fsync=True`` to sync the log after every written batch.
     """
 
-    def __init__(self, dlq_file: Path | None = None):
-        self._path = dlq_file or DLQ_FILE
-        self._lock = threading.Lock()
+    def __init__(
+        self,
+        dlq_file: Path | None = None,
+        batch_bytes: int = BATCH_BYTES,
+        flush_interval_ms: int = FLUSH_INTERVAL_MS,
+        fsync: bool = False,
+    ):
+        self._path = dlq_file or (DLQ_ZST_FILE if ZSTD_AVAILABLE else DLQ_FILE)
+        self._compressed = self._path.suffix == ".zst"
+        if self._compressed and not ZSTD_AVAILABLE:
+            raise ImportError(f"zstandard is required to open {self._path}")
+        self._cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if self._compressed else None
+        self._l1_path = _tier_path(self._path, "l1")
+        self._archive_path = _tier_path(self._path, "archive")
+        self._lock = threading.Lock()  # held while touching the log file
         self._items: dict[str, DLQItem] = {}
-        self._load()
+        # status -> item ids in that status (dicts used as ordered sets)
+        self._by_status: dict[str, dict[str, None]] = {
+            status: {} for status in
+            (STATUS_PENDING, STATUS_RETRYING, STATUS_RESOLVED, STATUS_QUARANTINED)
+        }
+        self._by_source: Counter[str] = Counter()  # source -> live item count
+        self._log_lines = 0  # lines in the L0 log, including buffered ones
+        self._batch_bytes = batch_bytes
+        self._flush_interval = flush_interval_ms / 1000.0
+        self._inbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._start_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._fd: int | None = None  # O_APPEND descriptor, opened on first write
+        self._fsync = fsync  # fsync after every written batch
+        self._closed = False
+        # Plain tier files left from before zstd was enabled are read in place
+        # of their missing .zst siblings and removed once compacted into them
+        legacy: list[Path] = []
+        clean = self._load(self._legacy_or(self._l1_path, legacy))
+        self._log_lines = 0  # only L0 lines count towards compaction
+        clean = self._load(self._legacy_or(self._path, legacy)) and clean
+        legacy_archive = self._legacy_or(self._archive_path, [])
+        rekeyed = self._rekey_legacy_ids()
+        for item in self._items.values():
+            self._by_status.setdefault(item.status, {})[item.id] = None
+            self._by_source[item.source] += 1
+        if not clean:
+            # Compacting a partial load would overwrite the files it failed to read
+            logger.warning("DLQ load incomplete; leaving %s uncompacted", self._path)
+        elif legacy or rekeyed or self._log_lines:
+            self.compact()
+        if clean and legacy_archive != self._archive_path:
+            self._migrate_archive(legacy_archive)
+            legacy.append(legacy_archive)
+        if clean:
+            for path in legacy:
+                path.unlink()
+                logger.info("Migrated DLQ file %s -> %s.zst", path, path)
+
+    def _legacy_or(self, tier: Path, legacy: list[Path]) -> Path:
+        """Return the plain file to read for a missing ``.zst`` tier, else ``tier``.
+
+        A plain file that is returned is also appended to ``legacy``.
+        """
+        plain = tier.with_suffix("")
+        if self._compressed and not tier.exists() and plain.exists():
+            legacy.append(plain)
+            return plain
+        return tier
+
+    def _migrate_archive(self, plain: Path) -> None:
+        """Compress a plain archive tier into its ``.zst`` sibling."""
+        tmp = self._archive_path.with_name(self._archive_path.name + ".tmp")
+        with open(plain, "rb") as src, open(tmp, "wb") as dst:
+            self._cctx.copy_stream(src, dst)
+        os.replace(tmp, self._archive_path)
 
     # ----- persistence -----
 
-    def _load(self) -> None:
-        """Load existing DLQ entries."""
-        if not self._path.exists():
+    def _iter_log(self, path: Path):
+        """Yield the raw JSONL lines of ``path``."""
+        if path.suffix == ".zst":
+            yield from self._read_zst(path).splitlines()
             return
+        size = path.stat().st_size
+        if size < MMAP_MIN_BYTES or not size:
+            yield from path.read_bytes().splitlines()
+            return
+        # Large log: walk the page-cache mapping line by line rather than
+        # holding the whole file plus a list of every line in memory
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end < 0:
+                    end = size
+                yield mm[pos:end]
+                pos = end + 1
+
+    def _read_zst(self, path: Path) -> bytes:
+        """Return the decompressed JSONL bytes of a ``.zst`` log."""
+        chunks = []
+        with open(path, "rb") as f:
+            reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+            try:
+                while chunk := reader.read(BATCH_BYTES):
+                    chunks.append(chunk)
+            except zstandard.ZstdError as exc:
+                # Torn final frame from a crash: keep everything before it
+                logger.warning("DLQ log %s ends in a damaged frame: %s", path, exc)
+        return b"".join(chunks)
+
+    def _encode(self, data: bytes) -> bytes:
+        """Frame ``data`` for the log file (one zstd frame when compressed)."""
+        return self._cctx.compress(data) if self._compressed else data
+
+    def _load(self, path: Path) -> bool:
+        """Load existing DLQ entries, replaying delta lines in order.
+
+        Returns False if reading stopped early on an unexpected error.
+        """
+        if not path.exists():
+            return True
         try:
-            with open(self._path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        d = json.loads(line)
+            for line in self._iter_log(path):
+                if not line.strip():
+                    continue
+                self._log_lines += 1
+                try:
+                    d = _loads(line)
+                    if "source" in d:
                         item = DLQItem.from_dict(d)
                         self._items[item.id] = item
-                    except (json.JSONDecodeError, KeyError):
                         continue
-            logger.debug("Loaded %d DLQ items from %s", len(self._items), self._path)
+                    item = self._items.get(d["id"])
+                    if item is not None:
+                        for name in DELTA_FIELDS:
+                            if name in d:
+                                value = d[name]
+                                if name in ("status", "error"):
+                                    value = _intern(value)
+                                setattr(item, name, value)
+                except (json.JSONDecodeError, KeyError):
+                    continue
+            logger.debug("Loaded %d DLQ items from %s", len(self._items), path)
         except Exception as exc:
             logger.warning("Could not load DLQ file: %s", exc)
+            return False
+        return True
+
+    def _set_status(self, item: DLQItem, status: str) -> None:
+        """Change ``item.status`` and keep ``_by_status`` in step."""
+        self._by_status.get(item.status, {}).pop(item.id, None)
+        item.status = status
+        self._by_status.setdefault(status, {})[item.id] = None
+
+    def _rekey_legacy_ids(self) -> bool:
+        """Re-key items whose stored id predates the current _generate_id."""
+        rekeyed = False
+        for item_id, item in list(self._items.items()):
+            new_id = _generate_id(item.source, item.url)
+            if new_id != item_id:
+                del self._items[item_id]
+                item.id = new_id
+                self._items[new_id] = item
+                rekeyed = True
+        return rekeyed
+
+    def _take_expired(self) -> list[DLQItem]:
+        """Remove and return resolved items last updated before ARCHIVE_AFTER."""
+        cutoff = datetime.now(timezone.utc) - ARCHIVE_AFTER
+        expired = []
+        resolved = self._by_status[STATUS_RESOLVED]
+        for item_id in list(resolved):
+            item = self._items[item_id]
+            try:
+                updated = datetime.fromisoformat(item.updated_at)
+            except (TypeError, ValueError):
+                continue
+            if updated.tzinfo is None:
+                updated = updated.replace(tzinfo=timezone.utc)
+            if updated < cutoff:
+                del resolved[item_id]
+                del self._items[item_id]
+                self._by_source[item.source] -= 1
+                expired.append(item)
+        return expired
 
     def _flush(self) -> None:
-        """Rewrite the entire DLQ file (compact)."""
+        """Compact: archive expired items, write a fresh L1, empty L0."""
+        # Lines queued before the rewrite must not land after it
+        self.flush()
         with self._lock:
-            with open(self._path, "w", encoding="utf-8") as f:
-                for item in self._items.values():
-                    f.write(json.dumps(item.to_dict(), default=str) + "\n")
+            expired = self._take_expired()
+            if expired:
+                fd = os.open(self._archive_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    _write_all(fd, self._encode(b"".join(i.to_json_line() for i in expired)))
+                finally:
+                    os.close(fd)
+                logger.info("Archived %d resolved DLQ items to %s",
+                            len(expired), self._archive_path)
+            data = b"".join(item.to_json_line() for item in self._items.values())
+            tmp = self._l1_path.with_name(self._l1_path.name + ".tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                _write_all(fd, self._encode(data))
+                if self._fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self._l1_path)
+            # Everything in L0 is now folded into L1
+            self._close_fd()
+            os.close(os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+            self._log_lines = 0
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        """Append a batch of log lines. Caller holds ``self._lock``."""
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        fd = self._fd
+        if self._compressed or not HAS_WRITEV:
+            # A compressed batch is a single frame, so it is joined anyway
+            _write_all(fd, self._encode(b"".join(batch)))
+        else:
+            # Plain-log batches go to the kernel as vectored writes
+            writev_all(fd, batch)
+        if self._fsync:
+            os.fsync(fd)
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _drain_inbox(self) -> None:
+        """Write everything queued, from the calling thread (no writer running)."""
+        batch = []
+        with self._lock:
+            while True:
+                try:
+                    msg = self._inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(msg, bytes):
+                    batch.append(msg)
+                elif isinstance(msg, threading.Event):
+                    msg.set()
+            if batch:
+                self._write_batch(batch)
+
+    def _flusher_loop(self) -> None:
+        """Single writer: coalesce queued lines for up to one flush interval."""
+        inbox = self._inbox
+        while True:
+            msg = inbox.get()
+            batch: list[bytes] = []
+            size = 0
+            waiters: list[threading.Event] = []
+            stop = False
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if msg is _STOP:
+                    stop = True
+                elif isinstance(msg, threading.Event):
+                    waiters.append(msg)
+                else:
+                    batch.append(msg)
+                    size += len(msg)
+                if stop or waiters or size >= self._batch_bytes:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    msg = inbox.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if batch:
+                with self._lock:
+                    self._write_batch(batch)
+            for done in waiters:
+                done.set()
+            if stop:
+                return
+
+    def _write_line(self, line: bytes) -> None:
+        self._log_lines += 1
+        self._inbox.put(line)
+        if self._flusher is None:
+            with self._start_lock:
+                start = self._flusher is None and not self._closed
+                if start:
+                    self._flusher = threading.Thread(
+                        target=self._flusher_loop, name="dlq-flusher", daemon=True
+                    )
+                    self._flusher.start()
+            if start:
+                atexit.register(self.close)
+            elif self._closed:
+                self._drain_inbox()
+
+    def flush(self) -> None:
+        """Block until every line queued so far has been written."""
+        flusher = self._flusher
+        if flusher is None:
+            self._drain_inbox()
+            return
+        done = threading.Event()
+        self._inbox.put(done)
+        while not done.wait(0.1):
+            if not flusher.is_alive():
+                self._drain_inbox()
+                return
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread and close the log fd."""
+        with self._start_lock:
+            self._closed = True
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._inbox.put(_STOP)
+            flusher.join()
+        self._drain_inbox()
+        with self._lock:
+            self._close_fd()
 
     def _append(self, item: DLQItem) -> None:
-        with self._lock:
-            with open(self._path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(item.to_dict(), default=str) + "\n")
+        self._write_line(item.to_json_line())
+
+    def _append_delta(self, item: DLQItem, fields: tuple[str, ...] = DELTA_FIELDS) -> None:
+        """Append a delta line carrying only ``fields`` of ``item``."""
+        delta = {"id": item.id}
+        for name in fields:
+            delta[name] = getattr(item, name)
+        self._write_line(_dumps_line(delta))
+        if self._log_lines > COMPACT_RATIO * len(self._items) + COMPACT_MIN_LINES:
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge L0 into a fresh L1 snapshot, archiving expired resolved items."""
+        self._flush()
 
     # ----- public API -----
 
@@ -197,15 +636,15 @@ class DeadLetterQueue:
 
         if existing and existing.status not in (STATUS_RESOLVED,):
             existing.retries += 1
-            existing.error = error
-            existing.updated_at = datetime.now(timezone.utc).isoformat()
+            existing.error = _intern(error)
+            existing.updated_at = _now_iso()
             if existing.retries >= QUARANTINE_AFTER:
-                existing.status = STATUS_QUARANTINED
+                self._set_status(existing, STATUS_QUARANTINED)
                 logger.warning("DLQ item quarantined after %d retries: %s %s",
                                existing.retries, source, url)
             else:
-                existing.status = STATUS_RETRYING
-            self._flush()  # update in place
+                self._set_status(existing, STATUS_RETRYING)
+            self._append_delta(existing)
             return existing
 
         item = DLQItem(
@@ -213,27 +652,33 @@ class DeadLetterQueue:
             url=url,
             error=error,
             metadata=metadata,
+            item_id=item_id,  # already hashed for the lookup above
         )
+        if existing:  # a resolved item is replaced by a fresh one
+            self._by_status[existing.status].pop(item_id, None)
+        else:
+            self._by_source[source] += 1
         self._items[item.id] = item
+        self._by_status[item.status][item.id] = None
         self._append(item)
         logger.info("DLQ enqueued: %s — %s (%s)", source, url, error[:80])
         return item
 
     def get_retryable(self) -> list[dict]:
         """Return pending/retrying items that haven't exceeded MAX_RETRIES."""
+        items = self._items
         return [
             item.to_dict()
-            for item in self._items.values()
-            if item.status in (STATUS_PENDING, STATUS_RETRYING)
-            and item.retries < MAX_RETRIES
+            for status in (STATUS_PENDING, STATUS_RETRYING)
+            for item in map(items.__getitem__, self._by_status[status])
+            if item.retries < MAX_RETRIES
         ]
 
     def get_quarantined(self) -> list[dict]:
         """Return items that have been permanently quarantined."""
         return [
-            item.to_dict()
-            for item in self._items.values()
-            if item.status == STATUS_QUARANTINED
+            self._items[item_id].to_dict()
+            for item_id in self._by_status[STATUS_QUARANTINED]
         ]
 
     def mark_resolved(self, item_id: str) -> bool:
@@ -241,9 +686,9 @@ class DeadLetterQueue:
         item = self._items.get(item_id)
         if not item:
             return False
-        item.status = STATUS_RESOLVED
-        item.updated_at = datetime.now(timezone.utc).isoformat()
-        self._flush()
+        self._set_status(item, STATUS_RESOLVED)
+        item.updated_at = _now_iso()
+        self._append_delta(item, ("status", "updated_at"))
         logger.info("DLQ resolved: %s", item_id)
         return True
 
@@ -253,41 +698,43 @@ class DeadLetterQueue:
         if not item:
             return False
         item.retries += 1
-        item.error = error
-        item.updated_at = datetime.now(timezone.utc).isoformat()
+        item.error = _intern(error)
+        item.updated_at = _now_iso()
         if item.retries >= QUARANTINE_AFTER:
-            item.status = STATUS_QUARANTINED
+            self._set_status(item, STATUS_QUARANTINED)
         else:
-            item.status = STATUS_RETRYING
-        self._flush()
+            self._set_status(item, STATUS_RETRYING)
+        self._append_delta(item)
         return True
 
     def purge_resolved(self) -> int:
         """Remove all resolved items. Returns count purged."""
-        before = len(self._items)
-        self._items = {
-            k: v for k, v in self._items.items()
-            if v.status != STATUS_RESOLVED
-        }
-        after = len(self._items)
-        if before != after:
+        resolved = self._by_status[STATUS_RESOLVED]
+        for item_id in resolved:
+            self._by_source[self._items.pop(item_id).source] -= 1
+        self._by_status[STATUS_RESOLVED] = {}
+        if resolved:
             self._flush()
-        return before - after
+        return len(resolved)
 
     def summary(self) -> dict:
         """Return a summary of DLQ status."""
-        status_counts: dict[str, int] = {}
-        source_counts: dict[str, int] = {}
-        for item in self._items.values():
-            status_counts[item.status] = status_counts.get(item.status, 0) + 1
-            source_counts[item.source] = source_counts.get(item.source, 0) + 1
+        status_counts = {
+            status: len(ids) for status, ids in self._by_status.items() if ids
+        }
+        items = self._items
+        retryable = sum(
+            items[item_id].retries < MAX_RETRIES
+            for status in (STATUS_PENDING, STATUS_RETRYING)
+            for item_id in self._by_status[status]
+        )
 
         s = {
-            "total": len(self._items),
+            "total": len(items),
             "by_status": status_counts,
-            "by_source": source_counts,
-            "retryable": len(self.get_retryable()),
-            "quarantined": len(self.get_quarantined()),
+            "by_source": {source: n for source, n in self._by_source.items() if n},
+            "retryable": retryable,
+            "quarantined": len(self._by_status[STATUS_QUARANTINED]),
             "dlq_file": str(self._path),
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
@@ -2,10 +2,86 @@
 Temporary script to diversify data sources for testing.
 This script adds source diversity to existing data so the buffer can work.
 """
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 PROCESSED_DIR = Path(__file__).parent.parent / "data" / "processed"
+CHUNK_ROWS = 50_000
+# Files at least this large are classified on all cores, one chunk per task
+PARALLEL_MIN_BYTES = 64 << 20
+
+# Keyword rules in priority order: the first matching rule wins, and every
+# URL rule outranks every text rule. Anything unmatched stays general News.
+URL_RULES = [
+    ('Government', ('.gov', 'city', 'council')),        # City/government websites
+    ('News', ('nj.com', 'tapinto', 'patch')),            # News sites
+]
+TEXT_RULES = [
+    ('Education', ('student', 'school', 'walkout', 'education')),          # Student/school related
+    ('Advocacy', ('advocate', 'community', 'organization', 'activist')),   # Advocacy/community
+    ('Legislative', ('bill', 'law', 'legislation', 'legislature', 'senate')),  # Legislative/policy
+]
+DEFAULT_SOURCE = 'News'
+SOURCE_CATEGORIES = ['Government', 'News', 'Education', 'Advocacy', 'Legislative']
+
+
+def _classify_masks(url, text):
+    """Vectorized classifier: one str.contains mask per rule."""
+    def mask(col, keywords):
+        pattern = '|'.join(re.escape(kw) for kw in keywords)
+        return col.str.contains(pattern, regex=True, na=False)
+
+    conditions = [mask(url, kws) for _, kws in URL_RULES]
+    conditions += [mask(text, kws) for _, kws in TEXT_RULES]
+    choices = [category for category, _ in URL_RULES + TEXT_RULES]
+    # np.select takes the first match per row, exactly like an if/elif chain
+    return np.select(conditions, choices, default=DEFAULT_SOURCE)
+
+
+def classify_sources(df):
+    """Assign a synthetic source to every row of *df* from its url/text.
+
+    Returns a Categorical over SOURCE_CATEGORIES (int8 codes), so counting
+    and merging on the column work on codes rather than Python strings.
+    """
+    def lowered(col):
+        if col not in df.columns:
+            return pd.Series('', index=df.index)
+        return df[col].astype(str).str.lower()
+
+    url = lowered('url')
+    text = lowered('text')
+    return pd.Categorical(_classify_masks(url, text), categories=SOURCE_CATEGORIES)
+
+
+def _classify_chunk(chunk):
+    """Classify one chunk; returns its original source counts and the chunk."""
+    original = chunk['source'].value_counts() if 'source' in chunk.columns else None
+    chunk['source'] = classify_sources(chunk)
+    return original, chunk
+
+
+def _classify_chunks(chunks, workers):
+    """Yield _classify_chunk results in file order, using *workers* processes."""
+    if workers <= 1:
+        yield from map(_classify_chunk, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Bounded window of in-flight chunks keeps memory flat
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_classify_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 
 def diversify_sources():
     """Add synthetic source diversity based on content patterns."""
@@ -15,46 +91,37 @@ def diversify_sources():
         print(f"ERROR: {clustered_path} not found")
         return
     
-    df = pd.read_csv(clustered_path)
-    print(f"Loaded {len(df)} records")
-    print(f"Original sources: {df['source'].value_counts().to_dict()}")
-    
-    # Diversify sources based on content patterns
-    def assign_diverse_source(row):
-        text = str(row.get('text', '')).lower()
-        url = str(row.get('url', '')).lower()
-        
-        # City/government websites
-        if any(domain in url for domain in ['.gov', 'city', 'council']):
-            return 'Government'
-        
-        # News sites
-        elif any(site in url for site in ['nj.com', 'tapinto', 'patch']):
-            return 'News'
-        
-        # Student/school related
-        elif any(word in text for word in ['student', 'school', 'walkout', 'education']):
-            return 'Education'
-        
-        # Advocacy/community
-        elif any(word in text for word in ['advocate', 'community', 'organization', 'activist']):
-            return 'Advocacy'
-        
-        # Legislative/policy
-        elif any(word in text for word in ['bill', 'law', 'legislation', 'legislature', 'senate']):
-            return 'Legislative'
-        
-        # Keep News for general content
-        else:
-            return 'News'
-    
-    # Apply diverse source assignment
-    df['source'] = df.apply(assign_diverse_source, axis=1)
-    
-    print(f"\nDiversified sources: {df['source'].value_counts().to_dict()}")
-    
-    # Save back
-    df.to_csv(clustered_path, index=False)
+    # Stream the file in chunks into a temp file, then swap it in atomically.
+    # Cells are read as raw strings so every column other than source is
+    # written back exactly as it was.
+    tmp_path = clustered_path.with_suffix('.csv.tmp')
+    original = pd.Series(dtype='int64')
+    diversified = pd.Series(dtype='int64')
+    total = 0
+    workers = os.cpu_count() or 1
+    if clustered_path.stat().st_size < PARALLEL_MIN_BYTES:
+        workers = 1
+    try:
+        reader = pd.read_csv(clustered_path, chunksize=CHUNK_ROWS,
+                             dtype=str, keep_default_na=False)
+        for i, (chunk_original, chunk) in enumerate(_classify_chunks(reader, workers)):
+            total += len(chunk)
+            if chunk_original is not None:
+                original = original.add(chunk_original, fill_value=0)
+            diversified = diversified.add(chunk['source'].value_counts(), fill_value=0)
+            chunk.to_csv(tmp_path, mode='w' if i == 0 else 'a',
+                         header=i == 0, index=False)
+        os.replace(tmp_path, clustered_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    def counts(series):
+        series = series[series > 0]  # categorical counts include empty categories
+        return series.sort_values(ascending=False, kind='stable').astype(int).to_dict()
+
+    print(f"Loaded {total} records")
+    print(f"Original sources: {counts(original)}")
+    print(f"\nDiversified sources: {counts(diversified)}")
     print(f"\nSaved diversified data to {clustered_path}")
 
 if __name__ == "__main__":
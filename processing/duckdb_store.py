@@ -8,10 +8,15 @@ Database path: data/processed/heat.duckdb
 """
 
 import sys
+import atexit
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
+import numpy as np
 import pandas as pd
 
 # ---------------------------------------------------------------------------
@@ -21,6 +26,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config import BASE_DIR, PROCESSED_DIR
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 try:
     import duckdb
 except ImportError:
@@ -33,18 +44,22 @@ except ImportError:
 # Logging
 # ---------------------------------------------------------------------------
 LOG_DIR = BASE_DIR / "data" / "logs"
-LOG_DIR.mkdir(parents=True, exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [DuckDB] %(levelname)s  %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_DIR / "duckdb_store.log", encoding="utf-8"),
-    ],
-)
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _configure_logging() -> None:
+    """Set up console + file logging on first database use, not at import."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [DuckDB] %(levelname)s  %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(LOG_DIR / "duckdb_store.log", encoding="utf-8"),
+        ],
+    )
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -129,6 +144,56 @@ _DDL_STATEMENTS: list[str] = [
 # Sequence used by signals auto-id
 _SEQUENCE_DDL = "CREATE SEQUENCE IF NOT EXISTS signal_id_seq START 1;"
 
+# Full schema as a single script so init_db parses and plans it in one call
+_SCHEMA_SCRIPT = _SEQUENCE_DDL + "".join(_DDL_STATEMENTS)
+
+# cluster_stats columns in table order; cluster_id is the upsert key
+_CLUSTER_STATS_COLUMNS: list[str] = [
+    "cluster_id", "signal_count", "source_count", "earliest_signal",
+    "latest_signal", "volume_score", "severity", "representative", "zip",
+    "computed_at",
+]
+
+# Columns written by ingest_signals (everything except the sequence id)
+_SIGNAL_COLUMNS: list[str] = [
+    "text", "source", "zip", "date", "ingested_at", "language", "signal_type",
+]
+
+# SQL defaults for signal columns missing from the input
+_SIGNAL_DEFAULTS: dict[str, str] = {
+    "text": "''",
+    "source": "'unknown'",
+    "zip": "'00000'",
+    "date": "current_timestamp",
+    "language": "'en'",
+    "signal_type": "'news'",
+}
+
+
+def _signals_insert_sql(source: str, present: set[str]) -> str:
+    """INSERT ... SELECT into signals from a text-typed *source* relation."""
+    exprs = []
+    for col in _SIGNAL_COLUMNS:
+        if col == "ingested_at":
+            exprs.append("current_timestamp")
+        elif col not in present:
+            exprs.append(_SIGNAL_DEFAULTS[col])
+        elif col == "date":
+            exprs.append('try_cast("date" AS TIMESTAMPTZ)')
+        else:
+            exprs.append(f'"{col}"')
+    return (
+        f"INSERT INTO signals ({', '.join(_SIGNAL_COLUMNS)}) "
+        f"SELECT {', '.join(exprs)} FROM {source}"
+    )
+
+
+def _as_text(value) -> str | None:
+    """Cell value as text for the Arrow path; None/NaN stay NULL."""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return str(value)
+
 
 # ---------------------------------------------------------------------------
 # Connection management
@@ -139,9 +204,54 @@ def _get_connection(db_path: Path | None = None) -> duckdb.DuckDBPyConnection:
     path = db_path or DB_PATH
     path.parent.mkdir(parents=True, exist_ok=True)
     conn = duckdb.connect(str(path))
+    # Naive timestamps are UTC, whatever the host's local zone; GLOBAL so
+    # every cursor opened on this connection parses them the same way
+    conn.execute("SET GLOBAL TimeZone = 'UTC'")
     return conn
 
 
+# Long-lived connection per database file for helpers called without one,
+# so repeated calls don't reopen the file and re-run the DDL
+_SHARED_CONNS: dict[Path, duckdb.DuckDBPyConnection] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _get_shared() -> duckdb.DuckDBPyConnection:
+    """Return the shared connection to DB_PATH, initializing it once."""
+    with _SHARED_LOCK:
+        conn = _SHARED_CONNS.get(DB_PATH)
+        if conn is None:
+            conn = _SHARED_CONNS[DB_PATH] = init_db(DB_PATH)
+        return conn
+
+
+def close_shared() -> None:
+    """Close the shared connection(s), releasing the database file lock."""
+    with _SHARED_LOCK:
+        while _SHARED_CONNS:
+            _, conn = _SHARED_CONNS.popitem()
+            conn.close()
+
+
+atexit.register(close_shared)
+
+_LOCAL = threading.local()
+
+
+def get_cursor() -> duckdb.DuckDBPyConnection:
+    """Return this thread's cursor on the shared connection.
+
+    Each cursor is its own session, so helpers called from several threads
+    run their queries concurrently instead of sharing one connection.
+    """
+    cursors = _LOCAL.__dict__.setdefault("cursors", {})
+    shared = _get_shared()
+    entry = cursors.get(DB_PATH)
+    if entry is None or entry[0] is not shared:
+        entry = cursors[DB_PATH] = (shared, shared.cursor())
+    return entry[1]
+
+
 # ---------------------------------------------------------------------------
 # Initialization & migration
 # ---------------------------------------------------------------------------
@@ -151,28 +261,28 @@ def init_db(db_path: Path | None = None) -> duckdb.DuckDBPyConnection:
 
     Returns an open DuckDB connection.
     """
+    _configure_logging()
     conn = _get_connection(db_path)
 
-    # Sequence first (referenced by signals table)
-    conn.execute(_SEQUENCE_DDL)
-
-    for ddl in _DDL_STATEMENTS:
-        conn.execute(ddl)
-
-    # Check current schema version
-    current = conn.execute(
-        "SELECT COALESCE(MAX(version), 0) FROM schema_version"
-    ).fetchone()[0]
-
-    if current < SCHEMA_VERSION:
-        conn.execute(
-            "INSERT INTO schema_version (version, description) VALUES (?, ?)",
-            [SCHEMA_VERSION, f"Schema v{SCHEMA_VERSION} — initial tables"],
-        )
-        logger.info("Applied schema version %d", SCHEMA_VERSION)
-    else:
+    # Check current schema version first; an up-to-date database needs no DDL
+    try:
+        current = conn.execute(
+            "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+        ).fetchone()[0]
+    except duckdb.CatalogException:
+        current = 0
+    if current >= SCHEMA_VERSION:
         logger.info("Schema already at version %d", current)
+        return conn
+
+    # One multi-statement script, sequence first (referenced by signals table)
+    conn.execute(_SCHEMA_SCRIPT)
 
+    conn.execute(
+        "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+        [SCHEMA_VERSION, f"Schema v{SCHEMA_VERSION} — initial tables"],
+    )
+    logger.info("Applied schema version %d", SCHEMA_VERSION)
     return conn
 
 
@@ -191,7 +301,8 @@ def ingest_signals(
     records : list[dict]
         Each dict should have at least ``text``, ``source``, ``zip``, ``date``.
     conn : DuckDBPyConnection, optional
-        Reuse an existing connection; otherwise a new one is opened.
+        Reuse an existing connection; otherwise the shared module
+        connection is used.
 
     Returns
     -------
@@ -201,18 +312,36 @@ def ingest_signals(
     if not records:
         return 0
 
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
+    if conn is None:
+        conn = get_cursor()
+
+    if PYARROW_AVAILABLE:
+        # Column-wise Arrow table straight from the dicts: DuckDB scans the
+        # buffers in place, with no pandas dtype inference in between
+        present = {key for record in records for key in record}
+        table = pa.table({
+            col: pa.array([_as_text(r.get(col)) for r in records], pa.string())
+            for col in _SIGNAL_DEFAULTS if col in present
+        })
+        conn.register("_tmp_signals", table)
+        try:
+            inserted = conn.execute(
+                _signals_insert_sql("_tmp_signals", present)
+            ).fetchone()[0]
+        finally:
+            conn.unregister("_tmp_signals")
+        logger.info("Ingested %d signals", inserted)
+        return inserted
 
     df = pd.DataFrame(records)
+    now = datetime.now(timezone.utc)
 
     # Ensure expected columns exist with defaults
     for col, default in [
         ("text", ""),
         ("source", "unknown"),
         ("zip", "00000"),
-        ("date", datetime.now(timezone.utc).isoformat()),
+        ("date", now.isoformat()),
         ("language", "en"),
         ("signal_type", "news"),
     ]:
@@ -221,22 +350,47 @@ def ingest_signals(
 
     # Coerce date
     df["date"] = pd.to_datetime(df["date"], utc=True, errors="coerce")
-    df["ingested_at"] = datetime.now(timezone.utc)
+    df["ingested_at"] = now
 
-    # Insert via temporary view
-    conn.register("_tmp_signals", df)
-    conn.execute("""
-        INSERT INTO signals (text, source, zip, date, ingested_at, language, signal_type)
-        SELECT text, source, zip, date, ingested_at, language, signal_type
-        FROM _tmp_signals
-    """)
-    conn.unregister("_tmp_signals")
+    # Bulk-append through the Appender (no SQL parse/plan); the id column
+    # is left out so its sequence default applies
+    conn.append("signals", df[_SIGNAL_COLUMNS], by_name=True)
 
     inserted = len(df)
     logger.info("Ingested %d signals", inserted)
 
-    if own_conn:
-        conn.close()
+    return inserted
+
+
+def ingest_signals_csv(
+    path: Path,
+    conn: duckdb.DuckDBPyConnection | None = None,
+) -> int:
+    """Bulk-insert signals straight from a CSV file.
+
+    Uses DuckDB's parallel CSV reader instead of a pandas round-trip.
+    Columns missing from the file get the same defaults as
+    :func:`ingest_signals`; every cell is read as text, so ZIP codes keep
+    their leading zeros.
+
+    Returns
+    -------
+    int
+        Number of rows inserted.
+    """
+    if conn is None:
+        conn = get_cursor()
+
+    source = "read_csv_auto(?, header=true, all_varchar=true)"
+    present = {
+        row[0] for row in
+        conn.execute(f"DESCRIBE SELECT * FROM {source}", [str(path)]).fetchall()
+    }
+    inserted = conn.execute(
+        _signals_insert_sql(source, present), [str(path)]
+    ).fetchone()[0]
+    logger.info("Ingested %d signals from %s", inserted, path.name)
+
     return inserted
 
 
@@ -251,29 +405,45 @@ def store_clusters(
     if df.empty:
         return 0
 
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
+    if conn is None:
+        conn = get_cursor()
 
-    df = df.copy()
-    if "assigned_at" not in df.columns:
-        df["assigned_at"] = datetime.now(timezone.utc)
-
-    conn.register("_tmp_clusters", df)
-    conn.execute("""
-        INSERT INTO clusters (signal_id, cluster_id, assigned_at)
-        SELECT signal_id, cluster_id, assigned_at
-        FROM _tmp_clusters
-    """)
-    conn.unregister("_tmp_clusters")
+    # No copy of the caller's frame: a missing assigned_at is filled by the
+    # column's DEFAULT current_timestamp
+    columns = ["signal_id", "cluster_id"]
+    if "assigned_at" in df.columns:
+        columns.append("assigned_at")
+    conn.append("clusters", df[columns], by_name=True)
     count = len(df)
     logger.info("Stored %d cluster assignments", count)
 
-    if own_conn:
-        conn.close()
     return count
 
 
+@functools.lru_cache(maxsize=None)
+def _cluster_stats_upsert_sql(present: frozenset) -> str:
+    """INSERT ... ON CONFLICT statement for a ``_tmp_stats`` view with *present* columns.
+
+    Cached per column set so each frame shape reuses one statement text.
+    """
+    select = []
+    for col in _CLUSTER_STATS_COLUMNS:
+        if col in present:
+            select.append(col)
+        elif col == "computed_at":
+            select.append("current_timestamp AS computed_at")
+        else:
+            select.append(f"NULL AS {col}")
+    updates = ", ".join(
+        f"{col} = EXCLUDED.{col}" for col in _CLUSTER_STATS_COLUMNS[1:]
+    )
+    return (
+        f"INSERT INTO cluster_stats ({', '.join(_CLUSTER_STATS_COLUMNS)}) "
+        f"SELECT {', '.join(select)} FROM _tmp_stats "
+        f"ON CONFLICT (cluster_id) DO UPDATE SET {updates}"
+    )
+
+
 def store_cluster_stats(
     df: pd.DataFrame,
     conn: duckdb.DuckDBPyConnection | None = None,
@@ -285,34 +455,20 @@ def store_cluster_stats(
     if df.empty:
         return 0
 
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
-
-    df = df.copy()
-    if "computed_at" not in df.columns:
-        df["computed_at"] = datetime.now(timezone.utc)
-
-    # Remove existing stats for these clusters, then insert fresh
-    cluster_ids = df["cluster_id"].tolist()
-    if cluster_ids:
-        placeholders = ", ".join(["?" for _ in cluster_ids])
-        conn.execute(
-            f"DELETE FROM cluster_stats WHERE cluster_id IN ({placeholders})",
-            cluster_ids,
-        )
+    if conn is None:
+        conn = get_cursor()
 
+    # Single-pass upsert: new clusters are inserted, existing rows are
+    # replaced in full (columns missing from df are reset, a missing
+    # computed_at becomes current_timestamp)
     conn.register("_tmp_stats", df)
-    conn.execute("""
-        INSERT INTO cluster_stats
-        SELECT * FROM _tmp_stats
-    """)
-    conn.unregister("_tmp_stats")
+    try:
+        conn.execute(_cluster_stats_upsert_sql(frozenset(df.columns)))
+    finally:
+        conn.unregister("_tmp_stats")
     count = len(df)
     logger.info("Stored stats for %d clusters", count)
 
-    if own_conn:
-        conn.close()
     return count
 
 
@@ -329,16 +485,10 @@ def query_signals(
     The caller is responsible for safe SQL construction when using
     dynamic inputs (prefer parameterized queries where possible).
     """
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
+    if conn is None:
+        conn = get_cursor()
 
-    try:
-        result = conn.execute(sql).fetchdf()
-    finally:
-        if own_conn:
-            conn.close()
-    return result
+    return conn.execute(sql).fetchdf()
 
 
 def get_recent_signals(
@@ -346,38 +496,26 @@ def get_recent_signals(
     conn: duckdb.DuckDBPyConnection | None = None,
 ) -> pd.DataFrame:
     """Return signals ingested within the last *hours* hours."""
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
+    if conn is None:
+        conn = get_cursor()
 
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    try:
-        result = conn.execute(
-            "SELECT * FROM signals WHERE date >= ? ORDER BY date DESC",
-            [cutoff],
-        ).fetchdf()
-    finally:
-        if own_conn:
-            conn.close()
-    return result
+    return conn.execute(
+        "SELECT * FROM signals WHERE date >= ? ORDER BY date DESC",
+        [cutoff],
+    ).fetchdf()
 
 
 def get_cluster_stats(
     conn: duckdb.DuckDBPyConnection | None = None,
 ) -> pd.DataFrame:
     """Return the full cluster_stats table as a DataFrame."""
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
+    if conn is None:
+        conn = get_cursor()
 
-    try:
-        result = conn.execute(
-            "SELECT * FROM cluster_stats ORDER BY volume_score DESC"
-        ).fetchdf()
-    finally:
-        if own_conn:
-            conn.close()
-    return result
+    return conn.execute(
+        "SELECT * FROM cluster_stats ORDER BY volume_score DESC"
+    ).fetchdf()
 
 
 # ---------------------------------------------------------------------------
@@ -407,19 +545,16 @@ def export_to_csv(
     if table not in allowed_tables:
         raise ValueError(f"Unknown table '{table}'. Allowed: {allowed_tables}")
 
-    own_conn = conn is None
-    if own_conn:
-        conn = init_db()
-
-    try:
-        df = conn.execute(f"SELECT * FROM {table}").fetchdf()
-    finally:
-        if own_conn:
-            conn.close()
+    if conn is None:
+        conn = get_cursor()
 
+    # Native COPY writes straight from the column store; ``table`` is safe
+    # to interpolate once checked against ``allowed_tables``
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False, encoding="utf-8")
-    logger.info("Exported %s → %s (%d rows)", table, path, len(df))
+    rows = conn.execute(
+        f"COPY (SELECT * FROM {table}) TO ? (FORMAT CSV, HEADER)", [str(path)]
+    ).fetchone()[0]
+    logger.info("Exported %s → %s (%d rows)", table, path, rows)
     return path
 
 
@@ -427,92 +562,107 @@ def export_to_csv(
 # Pipeline entry point
 # ---------------------------------------------------------------------------
 
-def run_duckdb_store() -> dict:
-    """Pipeline entry point: ingest CSVs into DuckDB analytical substrate.
-
-    Reads processed CSVs (all_records.csv, clustered_records.csv,
-    cluster_stats.csv, nlp_analysis.json) and persists them to DuckDB
-    tables. CSV files are kept for backward compatibility.
-
-    Returns
-    -------
-    dict
-        Summary with counts per table.
-    """
-    conn = init_db()
-    summary: dict[str, int] = {}
-
-    # 1. Ingest signals from all_records.csv
+def _store_signals_csv(conn: duckdb.DuckDBPyConnection) -> int:
+    """Ingest signals from all_records.csv."""
     signals_csv = PROCESSED_DIR / "all_records.csv"
-    if signals_csv.exists():
-        df = pd.read_csv(signals_csv, encoding="utf-8")
-        if not df.empty:
-            records = df.to_dict(orient="records")
-            summary["signals"] = ingest_signals(records, conn=conn)
-        else:
-            summary["signals"] = 0
-    else:
-        summary["signals"] = 0
+    if not signals_csv.exists():
         logger.warning("all_records.csv not found — skipping signal ingest")
+        return 0
+    return ingest_signals_csv(signals_csv, conn=conn)
 
-    # 2. Store cluster assignments from clustered_records.csv
+
+def _store_clusters_csv(conn: duckdb.DuckDBPyConnection) -> int:
+    """Store cluster assignments from clustered_records.csv."""
     clustered_csv = PROCESSED_DIR / "clustered_records.csv"
-    if clustered_csv.exists():
-        df = pd.read_csv(clustered_csv, encoding="utf-8")
-        if not df.empty and "cluster" in df.columns:
-            # Build signal_id → cluster_id mapping
-            df = df.reset_index()
-            cluster_df = df.rename(columns={"index": "signal_id", "cluster": "cluster_id"})
-            cluster_df = cluster_df[["signal_id", "cluster_id"]].copy()
-            cluster_df["signal_id"] = cluster_df["signal_id"] + 1  # 1-based IDs
-            summary["clusters"] = store_clusters(cluster_df, conn=conn)
-        else:
-            summary["clusters"] = 0
-    else:
-        summary["clusters"] = 0
+    if not clustered_csv.exists():
         logger.warning("clustered_records.csv not found — skipping cluster store")
+        return 0
+    # Only the cluster column is needed; row order gives the signal id
+    df = pd.read_csv(clustered_csv, encoding="utf-8",
+                     usecols=lambda col: col == "cluster")
+    if df.empty or "cluster" not in df.columns:
+        return 0
+    # Build signal_id → cluster_id mapping
+    df = df.reset_index()
+    cluster_df = df.rename(columns={"index": "signal_id", "cluster": "cluster_id"})
+    cluster_df = cluster_df[["signal_id", "cluster_id"]].copy()
+    cluster_df["signal_id"] = cluster_df["signal_id"] + 1  # 1-based IDs
+    return store_clusters(cluster_df, conn=conn)
 
-    # 3. Store cluster stats from cluster_stats.csv
+
+def _store_cluster_stats_csv(conn: duckdb.DuckDBPyConnection) -> int:
+    """Store cluster stats from cluster_stats.csv."""
     stats_csv = PROCESSED_DIR / "cluster_stats.csv"
-    if stats_csv.exists():
-        df = pd.read_csv(stats_csv, encoding="utf-8")
-        if not df.empty and "cluster_id" in df.columns:
-            summary["cluster_stats"] = store_cluster_stats(df, conn=conn)
-        else:
-            summary["cluster_stats"] = 0
-    else:
-        summary["cluster_stats"] = 0
+    if not stats_csv.exists():
         logger.warning("cluster_stats.csv not found — skipping cluster stats")
+        return 0
+    df = pd.read_csv(stats_csv, encoding="utf-8")
+    if df.empty or "cluster_id" not in df.columns:
+        return 0
+    return store_cluster_stats(df, conn=conn)
+
 
-    # 4. Store NLP results if available
-    nlp_json = PROCESSED_DIR / "nlp_analysis.json"
+def _store_nlp_csv(conn: duckdb.DuckDBPyConnection) -> int:
+    """Store NLP results from records_with_nlp.csv if available."""
     records_nlp_csv = PROCESSED_DIR / "records_with_nlp.csv"
-    if records_nlp_csv.exists():
-        df = pd.read_csv(records_nlp_csv, encoding="utf-8")
-        if not df.empty and "keywords" in df.columns:
-            nlp_rows = []
-            for idx, row in df.iterrows():
-                nlp_rows.append({
-                    "signal_id": idx + 1,
-                    "keywords": str(row.get("keywords", "")),
-                    "topics": str(row.get("categories", "")),
-                })
-            nlp_df = pd.DataFrame(nlp_rows)
-            nlp_df["processed_at"] = pd.Timestamp.now(tz="UTC")
-            conn.register("_tmp_nlp", nlp_df)
-            conn.execute("""
-                INSERT INTO nlp_results (signal_id, keywords, topics, processed_at)
-                SELECT signal_id, keywords, topics, processed_at
-                FROM _tmp_nlp
-            """)
-            conn.unregister("_tmp_nlp")
-            summary["nlp_results"] = len(nlp_df)
-        else:
-            summary["nlp_results"] = 0
-    else:
-        summary["nlp_results"] = 0
+    if not records_nlp_csv.exists():
+        return 0
+    df = pd.read_csv(records_nlp_csv, encoding="utf-8")
+    if df.empty or "keywords" not in df.columns:
+        return 0
+    # Column-wise projection; missing values become empty strings
+    topics = df["categories"] if "categories" in df.columns else ""
+    nlp_df = pd.DataFrame({
+        "signal_id": np.arange(1, len(df) + 1, dtype=np.int32),
+        "keywords": df["keywords"].fillna("").astype(str).to_numpy(),
+        "topics": pd.Series(topics, index=df.index).fillna("").astype(str).to_numpy(),
+        "processed_at": pd.Timestamp.now(tz="UTC"),
+    })
+    conn.append("nlp_results", nlp_df, by_name=True)
+    return len(nlp_df)
 
-    conn.close()
+
+def _with_cursor(task, conn: duckdb.DuckDBPyConnection) -> int:
+    """Run *task* on its own cursor (a separate session on the same database)."""
+    cursor = conn.cursor()
+    try:
+        return task(cursor)
+    finally:
+        cursor.close()
+
+
+def run_duckdb_store() -> dict:
+    """Pipeline entry point: ingest CSVs into DuckDB analytical substrate.
+
+    Reads processed CSVs (all_records.csv, clustered_records.csv,
+    cluster_stats.csv, records_with_nlp.csv) and persists them to DuckDB
+    tables. CSV files are kept for backward compatibility. The four
+    loads touch separate tables, so they run concurrently, each on its
+    own cursor.
+
+    Returns
+    -------
+    dict
+        Summary with counts per table.
+    """
+    conn = init_db()
+    tasks = {
+        "signals": _store_signals_csv,
+        "clusters": _store_clusters_csv,
+        "cluster_stats": _store_cluster_stats_csv,
+        "nlp_results": _store_nlp_csv,
+    }
+    try:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = {
+                name: pool.submit(_with_cursor, task, conn)
+                for name, task in tasks.items()
+            }
+            summary: dict[str, int] = {
+                name: future.result() for name, future in futures.items()
+            }
+    finally:
+        conn.close()
     logger.info("DuckDB store complete: %s", summary)
     return summary
 
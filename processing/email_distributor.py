@@ -15,8 +15,12 @@ from __future__ import annotations
 
 import os
 import json
+import functools
 import logging
-from datetime import datetime
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
@@ -27,7 +31,8 @@ logger = logging.getLogger(__name__)
 
 try:
     import boto3
-    from botocore.exceptions import ClientError
+    from botocore.config import Config
+    from botocore.exceptions import BotoCoreError, ClientError
     SES_AVAILABLE = True
 except ImportError:
     SES_AVAILABLE = False
@@ -43,9 +48,11 @@ DEFAULT_RECIPIENTS = [
     e.strip() for e in os.getenv("SES_RECIPIENT_EMAILS", "").split(",") if e.strip()
 ]
 
-TRACKING_DIR = Path(__file__).resolve().parent.parent / "data" / "tracking"
-TRACKING_DIR.mkdir(parents=True, exist_ok=True)
+TRACKING_DIR = Path(__file__).parent.parent / "data" / "tracking"
 EMAIL_LOG = TRACKING_DIR / "email_sent.json"
+EMAIL_LOG_MAX = 500  # entries kept in the log
+MAX_SEND_WORKERS = 16  # concurrent SES requests per send_email call
+SES_MAX_DESTINATIONS = 50  # SES limit on recipients of one raw message
 
 
 # ---------------------------------------------------------------------------
@@ -59,22 +66,107 @@ def _load_email_log() -> list[dict]:
     return []
 
 
+@functools.lru_cache(maxsize=1)
+def _ensure_tracking_dir():
+    """Create the tracking directory on first write rather than at import."""
+    TRACKING_DIR.mkdir(parents=True, exist_ok=True)
+
+
 def _save_email_log(log: list[dict]):
+    _ensure_tracking_dir()
     with open(EMAIL_LOG, "w") as f:
         json.dump(log, f, indent=2)
 
 
-def _record_email(recipient: str, subject: str, status: str, message_id: str = ""):
-    log = _load_email_log()
-    log.append({
+def _utc_stamp() -> str:
+    """Current UTC time in the log's ``...Z`` ISO format."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _email_entry(recipient: str, subject: str, status: str, sent_at: str,
+                 message_id: str = "") -> dict:
+    return {
         "recipient": recipient,
         "subject": subject,
         "status": status,
         "message_id": message_id,
-        "sent_at": datetime.utcnow().isoformat() + "Z",
-    })
-    # Keep last 500 entries
-    _save_email_log(log[-500:])
+        "sent_at": sent_at,
+    }
+
+
+# In-memory copy of the log, loaded on first use; the deque drops the
+# oldest entries itself so nothing is re-read or sliced per send
+_EMAIL_CACHE: deque | None = None
+_EMAIL_LOG_LOCK = threading.Lock()
+
+
+def _append_email_log(entries: list[dict]):
+    """Add a batch of entries and rewrite the log once."""
+    global _EMAIL_CACHE
+    if not entries:
+        return
+    with _EMAIL_LOG_LOCK:
+        if _EMAIL_CACHE is None:
+            _EMAIL_CACHE = deque(_load_email_log(), maxlen=EMAIL_LOG_MAX)
+        _EMAIL_CACHE.extend(entries)
+        _save_email_log(list(_EMAIL_CACHE))
+
+
+_SES_CLIENT = None
+_SES_LOCK = threading.Lock()
+
+
+def _get_ses():
+    """Return the shared SES client, creating it on first use.
+
+    Client construction (endpoint resolution, credential chain, service
+    model loading) is paid once; the pooled HTTPS connections are reused
+    across sends.
+    """
+    global _SES_CLIENT
+    with _SES_LOCK:
+        if _SES_CLIENT is None:
+            _SES_CLIENT = boto3.client(
+                "ses",
+                region_name=SES_REGION,
+                config=Config(
+                    max_pool_connections=32,
+                    retries={"max_attempts": 3, "mode": "adaptive"},
+                ),
+            )
+        return _SES_CLIENT
+
+
+def _encode_message(
+    subject: str,
+    html_body: str,
+    text_body: str,
+    attachments: list[tuple[str, bytes]] | None,
+) -> tuple[str, str]:
+    """Encode the shared MIME message once.
+
+    Returns its header block (without ``To``) and its encoded body, so each
+    recipient only costs a ``To`` header line.
+    """
+    msg = MIMEMultipart("mixed")
+    msg["Subject"] = subject
+    msg["From"] = SES_SENDER
+
+    # Body
+    body_part = MIMEMultipart("alternative")
+    body_part.attach(MIMEText(text_body, "plain", "utf-8"))
+    body_part.attach(MIMEText(html_body, "html", "utf-8"))
+    msg.attach(body_part)
+
+    # Attachments
+    if attachments:
+        for filename, data in attachments:
+            att = MIMEApplication(data)
+            att.add_header("Content-Disposition", "attachment", filename=filename)
+            msg.attach(att)
+
+    head, _, body = msg.as_string().partition("\n\n")
+    return head, body
 
 
 # ---------------------------------------------------------------------------
@@ -87,6 +179,7 @@ def send_email(
     html_body: str,
     text_body: str | None = None,
     attachments: list[tuple[str, bytes]] | None = None,
+    bcc: bool = False,
 ) -> list[dict]:
     """
     Send an email via AWS SES.
@@ -103,6 +196,11 @@ def send_email(
         Plain-text fallback. Auto-generated if omitted.
     attachments : list of (filename, bytes), optional
         Files to attach (e.g. JSON report).
+    bcc : bool
+        Deliver one message to up to SES_MAX_DESTINATIONS recipients per
+        SES call (``To`` is the sender, recipients are hidden) instead of
+        one call per recipient. Recipients in a call share its
+        ``message_id`` and its outcome.
 
     Returns
     -------
@@ -120,53 +218,64 @@ def send_email(
 
     if not SES_AVAILABLE:
         logger.error("boto3 not available — cannot send email.")
-        for r in recipients:
-            _record_email(r, subject, "skipped_no_boto3")
+        sent_at = _utc_stamp()
+        _append_email_log([_email_entry(r, subject, "skipped_no_boto3", sent_at) for r in recipients])
         return [{"email": r, "status": "skipped", "message_id": ""} for r in recipients]
 
     if not os.getenv("AWS_ACCESS_KEY_ID") or not os.getenv("AWS_SECRET_ACCESS_KEY"):
         logger.warning("AWS credentials not set — logging email instead of sending.")
-        for r in recipients:
-            _record_email(r, subject, "skipped_no_credentials")
+        sent_at = _utc_stamp()
+        _append_email_log([_email_entry(r, subject, "skipped_no_credentials", sent_at)
+                           for r in recipients])
         return [{"email": r, "status": "skipped", "message_id": ""} for r in recipients]
 
-    ses = boto3.client("ses", region_name=SES_REGION)
-    results = []
-
-    for recipient in recipients:
-        msg = MIMEMultipart("mixed")
-        msg["Subject"] = subject
-        msg["From"] = SES_SENDER
-        msg["To"] = recipient
-
-        # Body
-        body_part = MIMEMultipart("alternative")
-        body_part.attach(MIMEText(text_body, "plain", "utf-8"))
-        body_part.attach(MIMEText(html_body, "html", "utf-8"))
-        msg.attach(body_part)
-
-        # Attachments
-        if attachments:
-            for filename, data in attachments:
-                att = MIMEApplication(data)
-                att.add_header("Content-Disposition", "attachment", filename=filename)
-                msg.attach(att)
+    ses = _get_ses()
+    head, body = _encode_message(subject, html_body, text_body, attachments)
 
+    def send_one(destinations: list[str]) -> list[tuple[dict, dict]]:
+        to = SES_SENDER if bcc else destinations[0]
         try:
             response = ses.send_raw_email(
                 Source=SES_SENDER,
-                Destinations=[recipient],
-                RawMessage={"Data": msg.as_string()},
+                Destinations=destinations,
+                RawMessage={"Data": f"{head}\nTo: {to}\n\n{body}"},
             )
             mid = response.get("MessageId", "")
-            logger.info("Email sent to %s — MessageId: %s", recipient, mid)
-            _record_email(recipient, subject, "sent", mid)
-            results.append({"email": recipient, "status": "sent", "message_id": mid})
-        except ClientError as e:
-            error_msg = e.response["Error"]["Message"]
-            logger.error("Failed to email %s: %s", recipient, error_msg)
-            _record_email(recipient, subject, f"failed: {error_msg}")
-            results.append({"email": recipient, "status": "failed", "message_id": ""})
+            sent_at = _utc_stamp()
+            logger.info("Email sent to %s — MessageId: %s", ", ".join(destinations), mid)
+            return [({"email": r, "status": "sent", "message_id": mid},
+                     _email_entry(r, subject, "sent", sent_at, mid)) for r in destinations]
+        except (ClientError, BotoCoreError) as e:
+            # Connection and credential errors fail this batch only, so the
+            # other workers' sends are still returned and logged
+            if isinstance(e, ClientError):
+                error_msg = e.response["Error"]["Message"]
+            else:
+                error_msg = str(e)
+            sent_at = _utc_stamp()
+            logger.error("Failed to email %s: %s", ", ".join(destinations), error_msg)
+            return [({"email": r, "status": "failed", "message_id": ""},
+                     _email_entry(r, subject, f"failed: {error_msg}", sent_at))
+                    for r in destinations]
+
+    if bcc:
+        batches = [recipients[i:i + SES_MAX_DESTINATIONS]
+                   for i in range(0, len(recipients), SES_MAX_DESTINATIONS)]
+    else:
+        batches = [[r] for r in recipients]
+
+    # SES round-trips are I/O-bound: overlap them, keeping recipient order
+    results = []
+    log_entries = []
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_SEND_WORKERS, len(batches))) as pool:
+            for outcomes in pool.map(send_one, batches):
+                for result, entry in outcomes:
+                    results.append(result)
+                    log_entries.append(entry)
+    finally:
+        # One log write for the whole batch, even if a send raised midway
+        _append_email_log(log_entries)
 
     return results
 
@@ -180,11 +289,14 @@ def distribute_report(
     html_body: str,
     recipients: list[str] | None = None,
     subject_prefix: str = "HEAT Report",
+    bcc: bool = True,
 ) -> list[dict]:
     """
     Distribute a generated report via email.
 
     Attaches the JSON report as a file and uses the HTML as the email body.
+    Every recipient gets the same report, so by default it goes out as
+    one BCC-style SES call per SES_MAX_DESTINATIONS recipients.
     """
     meta = report_json.get("meta", {})
     template = meta.get("template", "report")
@@ -201,6 +313,7 @@ def distribute_report(
         subject=subject,
         html_body=html_body,
         attachments=attachments,
+        bcc=bcc,
     )
 
 
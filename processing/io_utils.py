@@ -0,0 +1,38 @@
+"""
+HEAT — Low-level append helpers (Team Delta)
+
+Vectored writes shared by the append-only logs in ``data_lineage`` and
+``dead_letter_queue``.
+"""
+import os
+
+HAS_WRITEV = hasattr(os, "writev")
+
+
+def _iov_max() -> int:
+    """Most buffers one writev call accepts; sysconf gives -1 if unknown."""
+    try:
+        return max(os.sysconf("SC_IOV_MAX"), 16)
+    except (AttributeError, ValueError, OSError):
+        return 1024
+
+
+IOV_MAX = _iov_max()
+
+
+def writev_all(fd: int, bufs: list[bytes]) -> None:
+    """Write every buffer in ``bufs`` to ``fd``, IOV_MAX buffers per writev.
+
+    A short write resumes from the unwritten tail of the partly written
+    buffer; the buffers are never joined, and ``bufs`` is left untouched.
+    """
+    i, n = 0, len(bufs)
+    while i < n:
+        written = os.writev(fd, bufs[i:i + IOV_MAX])
+        while i < n and written >= len(bufs[i]):
+            written -= len(bufs[i])
+            i += 1
+        if written:
+            # Short writes are rare on regular files
+            bufs = bufs.copy()
+            bufs[i] = memoryview(bufs[i])[written:]
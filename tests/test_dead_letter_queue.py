@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the HEAT dead-letter queue.
+
+Covers:
+  - enqueue / mark_failed / mark_resolved state transitions
+  - delta-log persistence and replay on load
+  - background batching of log writes
+  - compaction into the L1 snapshot, archiving and purge_resolved
+  - zstd-framed logs and migration from plain JSONL
+"""
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+_processing_dir = str(Path(__file__).parent.parent / "processing")
+if _processing_dir not in sys.path:
+    sys.path.insert(0, _processing_dir)
+
+from dead_letter_queue import (
+    ARCHIVE_AFTER,
+    DeadLetterQueue,
+    MAX_RETRIES,
+    STATUS_PENDING,
+    STATUS_RETRYING,
+    STATUS_RESOLVED,
+)
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def test_mutations_append_deltas(tmp_path):
+    path = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(path)
+    item = dlq.enqueue("rss_scraper", "https://example.com/a", "timeout")
+    dlq.enqueue("rss_scraper", "https://example.com/b", "HTTP 500")
+    dlq.mark_failed(item.id, "timeout again")
+    dlq.flush()
+
+    lines = _lines(path)
+    assert len(lines) == 3
+    assert lines[-1]["id"] == item.id
+    assert lines[-1]["status"] == STATUS_RETRYING
+    assert "source" not in lines[-1]
+
+
+def test_reload_replays_deltas(tmp_path):
+    path = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(path)
+    a = dlq.enqueue("rss_scraper", "https://example.com/a", "timeout")
+    b = dlq.enqueue("google_news", "https://example.com/b", "HTTP 429")
+    for _ in range(MAX_RETRIES):
+        dlq.mark_failed(a.id, "still failing")
+    dlq.mark_resolved(b.id)
+    dlq.close()
+
+    reloaded = DeadLetterQueue(path)
+    assert [i["id"] for i in reloaded.get_quarantined()] == [a.id]
+    assert reloaded.get_retryable() == []
+    assert reloaded._items[b.id].status == STATUS_RESOLVED
+    assert reloaded._items[a.id].retries == MAX_RETRIES
+    assert reloaded._items[a.id].error == "still failing"
+
+    # Loading folds L0 into an L1 snapshot with one full record per item
+    lines = _lines(tmp_path / "dlq.l1.jsonl")
+    assert len(lines) == 2
+    assert all("source" in line for line in lines)
+    assert path.read_bytes() == b""
+
+
+def test_purge_resolved(tmp_path):
+    path = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(path)
+    a = dlq.enqueue("rss_scraper", "https://example.com/a", "timeout")
+    b = dlq.enqueue("rss_scraper", "https://example.com/b", "timeout")
+    dlq.mark_resolved(a.id)
+
+    assert dlq.purge_resolved() == 1
+    assert [i["id"] for i in dlq.get_retryable()] == [b.id]
+    assert [line["id"] for line in _lines(tmp_path / "dlq.l1.jsonl")] == [b.id]
+    assert DeadLetterQueue(path)._items[b.id].status == STATUS_PENDING
+
+
+def test_background_flusher_batches_writes(tmp_path):
+    path = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(path, flush_interval_ms=10)
+    for i in range(50):
+        dlq.enqueue("rss_scraper", f"https://example.com/{i}", "timeout")
+
+    # No explicit flush: the daemon thread writes the batch on its own
+    deadline = time.monotonic() + 5
+    while not path.exists() or len(_lines(path)) < 50:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    dlq.close()
+    assert len(_lines(path)) == 50
+
+
+def test_failed_load_skips_compaction(tmp_path):
+    path = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(path)
+    dlq.enqueue("rss_scraper", "https://example.com/a", "timeout")
+    dlq.enqueue("rss_scraper", "https://example.com/b", "timeout")
+    dlq.flush()
+    # A non-object record aborts the load partway through
+    lines = path.read_bytes().splitlines(keepends=True)
+    original = lines[0] + b"5\n" + lines[1]
+    path.write_bytes(original)
+
+    assert len(DeadLetterQueue(path)._items) == 1
+    assert path.read_bytes() == original
+    assert not (tmp_path / "dlq.l1.jsonl").exists()
+
+
+def test_zstd_log_migrates_and_survives_torn_frame(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    plain = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(plain)
+    a = dlq.enqueue("rss_scraper", "https://example.com/a", "timeout")
+    dlq.close()
+
+    path = tmp_path / "dlq.jsonl.zst"
+    dlq = DeadLetterQueue(path)
+    assert not plain.exists()
+    b = dlq.enqueue("rss_scraper", "https://example.com/b", "timeout")
+    dlq.mark_resolved(a.id)
+    dlq.close()
+
+    # The migrated snapshot is in L1; the appended batch is one L0 frame
+    assert (tmp_path / "dlq.l1.jsonl.zst").exists()
+    raw = path.read_bytes()
+    lines = zstandard.ZstdDecompressor().stream_reader(
+        raw, read_across_frames=True).read().splitlines()
+    assert len(lines) == 2
+
+    # A partially written final frame is dropped, earlier frames still load
+    path.write_bytes(raw + zstandard.ZstdCompressor().compress(b'{"id": "x"}\n' * 50)[:-8])
+    reloaded = DeadLetterQueue(path)
+    assert reloaded._items[a.id].status == STATUS_RESOLVED
+    assert reloaded._items[b.id].status == STATUS_PENDING
+
+
+def test_zstd_migrates_legacy_l1_and_archive(tmp_path):
+    pytest.importorskip("zstandard")
+    plain = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(plain)
+    a = dlq.enqueue("rss_scraper", "https://example.com/a", "timeout")
+    dlq.close()
+    DeadLetterQueue(plain).close()  # compacts everything into the plain L1
+    plain.unlink()
+    (tmp_path / "dlq.archive.jsonl").write_text('{"id": "old"}\n')
+
+    path = tmp_path / "dlq.jsonl.zst"
+    assert set(DeadLetterQueue(path)._items) == {a.id}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "dlq.archive.jsonl.zst", "dlq.jsonl.zst", "dlq.l1.jsonl.zst"]
+    assert set(DeadLetterQueue(path)._items) == {a.id}
+
+
+def test_compaction_archives_expired_resolved(tmp_path, monkeypatch):
+    import dead_letter_queue
+    monkeypatch.setattr(dead_letter_queue, "DLQ_SUMMARY_FILE", tmp_path / "summary.json")
+    path = tmp_path / "dlq.jsonl"
+    dlq = DeadLetterQueue(path)
+    old = dlq.enqueue("rss_scraper", "https://example.com/old", "timeout")
+    new = dlq.enqueue("rss_scraper", "https://example.com/new", "timeout")
+    dlq.mark_resolved(old.id)
+    dlq.mark_resolved(new.id)
+    old.updated_at = (datetime.now(timezone.utc) - 2 * ARCHIVE_AFTER).isoformat()
+    dlq.compact()
+
+    assert [line["id"] for line in _lines(tmp_path / "dlq.archive.jsonl")] == [old.id]
+    assert [line["id"] for line in _lines(tmp_path / "dlq.l1.jsonl")] == [new.id]
+    assert dlq.summary()["by_source"] == {"rss_scraper": 1}
+    dlq.close()
+    assert set(DeadLetterQueue(path)._items) == {new.id}
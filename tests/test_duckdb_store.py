@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for the HEAT DuckDB store.
+
+Covers:
+  - timestamp handling in ingest_signals under a non-UTC local zone
+"""
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+_processing_dir = str(Path(__file__).parent.parent / "processing")
+
+
+def test_naive_and_aware_dates_are_utc(tmp_path):
+    # DuckDB takes its default zone from TZ when it is first loaded, so the
+    # check runs in a fresh interpreter with a non-UTC local zone
+    script = textwrap.dedent(f"""
+        import sys
+        sys.path.insert(0, {_processing_dir!r})
+        from duckdb_store import ingest_signals, init_db
+        conn = init_db(__import__("pathlib").Path({str(tmp_path / "heat.duckdb")!r}))
+        ingest_signals([
+            {{"text": "a", "zip": "07060", "date": "2026-01-15T10:00:00Z"}},
+            {{"text": "b", "zip": "07060", "date": "2026-01-15 10:00:00"}},
+            {{"text": "c", "zip": "07060", "date": "2026-01-15T12:00:00+02:00"}},
+        ], conn=conn)
+        for (date,) in conn.execute("SELECT date FROM signals ORDER BY id").fetchall():
+            print(date.isoformat())
+    """)
+    env = {**os.environ, "TZ": "America/New_York"}
+    out = subprocess.run([sys.executable, "-c", script], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    assert out.split() == ["2026-01-15T10:00:00"] * 3